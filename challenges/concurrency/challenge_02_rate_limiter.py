@@ -60,7 +60,7 @@ async def test_limits_concurrency():
 
 
 def _run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
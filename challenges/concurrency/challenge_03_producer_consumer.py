@@ -14,8 +14,9 @@ Requirements:
 3. Ensure threads join cleanly.
 
 Hints:
-- Call queue.task_done() after processing.
-- Use queue.join() to wait for all tasks.
+- The sentinel already marks end-of-stream; joining the consumer thread tells
+  you every item was processed.
+- queue.task_done()/queue.join() are not needed on top of the sentinel.
 
 Run tests:
     python challenges/concurrency/challenge_03_producer_consumer.py
@@ -2,26 +2,129 @@
 Solution: parallel_map
 
 Key Insights:
-1. ThreadPoolExecutor.map preserves input order, simplifying result handling.
-2. Using a context manager ensures the pool shuts down cleanly.
+1. ThreadPool.imap preserves input order, simplifying result handling.
+2. Pools are cached per max_workers, so repeated calls reuse warm worker
+   threads instead of paying thread start-up and join on every call.
 3. Converting to list forces evaluation and collects results.
+4. ThreadPool skips the per-item Future that ThreadPoolExecutor allocates, so
+   cheap functions spend less time in lock acquire/release bookkeeping.
+5. An atexit hook shuts the cached pools down cleanly at interpreter exit.
+6. Inputs of at most one item (or a single worker) gain nothing from threads,
+   so they run through the built-in map without touching the pool.
+7. imap's chunksize hands each worker a batch of items per task, so the
+   dispatch cost is paid once per chunk rather than once per item. The
+   default aims for about four chunks per worker.
+8. parallel_for_each is for side-effect-only work: plain threads drain a
+   shared deque, so no result objects are created per item.
+9. Threads only help I/O-bound work because of the GIL. parallel_map_cpu uses
+   ProcessPoolExecutor to spread CPU-bound work across cores, with chunksize
+   to amortize pickling and IPC. func and items must be picklable.
 
 Alternative Approaches:
+- ThreadPoolExecutor.map has the same ordering guarantee with a Future per item.
 - Submit futures individually and sort by input order; map is simpler.
+- `with ThreadPool(...)` per call is simpler but re-creates threads each time.
 """
 
 from __future__ import annotations
 
-from concurrent.futures import ThreadPoolExecutor
-from typing import Iterable, Callable, Any, List
+import atexit
+import threading
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.pool import ThreadPool
+from typing import Iterable, Callable, Any, Dict, List, Optional
 
 
 # === SOLUTION ===
 
 
-def parallel_map(func: Callable[[Any], Any], iterable: Iterable[Any], max_workers: int = 4) -> List[Any]:
-    with ThreadPoolExecutor(max_workers=max_workers) as ex:
-        return list(ex.map(func, iterable))
+_POOLS: Dict[int, ThreadPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def _get_pool(max_workers: int) -> ThreadPool:
+    pool = _POOLS.get(max_workers)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.get(max_workers)
+            if pool is None:
+                pool = _POOLS[max_workers] = ThreadPool(max_workers)
+    return pool
+
+
+@atexit.register
+def _shutdown_pools() -> None:
+    with _POOLS_LOCK:
+        for pool in _POOLS.values():
+            pool.close()
+            pool.join()
+        _POOLS.clear()
+
+
+def parallel_map(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    max_workers: int = 4,
+    chunksize: Optional[int] = None,
+) -> List[Any]:
+    if max_workers <= 1:
+        return list(map(func, iterable))
+    items = list(iterable)
+    if len(items) <= 1:
+        return list(map(func, items))
+    if chunksize is None:
+        chunksize = max(1, len(items) // (4 * max_workers))
+    pool = _get_pool(max_workers)
+    return list(pool.imap(func, items, chunksize))
+
+
+def parallel_map_cpu(
+    func: Callable[[Any], Any],
+    iterable: Iterable[Any],
+    max_workers: Optional[int] = None,
+    chunksize: int = 1,
+) -> List[Any]:
+    """Like parallel_map, but in worker processes; func must be picklable."""
+    with ProcessPoolExecutor(max_workers=max_workers) as ex:
+        return list(ex.map(func, iterable, chunksize=chunksize))
+
+
+def parallel_for_each(
+    func: Callable[[Any], Any], iterable: Iterable[Any], max_workers: int = 4
+) -> None:
+    """Call func on every item for its side effects; results are discarded.
+
+    Prefer this over parallel_map when nothing is collected. Items run in no
+    particular order, and the first exception raised by func is re-raised once
+    all workers have stopped.
+    """
+    if max_workers <= 0:
+        raise ValueError("max_workers must be greater than 0")
+    pending = deque(iterable)
+    errors: List[BaseException] = []
+
+    def worker() -> None:
+        popleft = pending.popleft
+        while not errors:
+            try:
+                item = popleft()
+            except IndexError:
+                return
+            try:
+                func(item)
+            except BaseException as exc:
+                errors.append(exc)
+
+    threads = [
+        threading.Thread(target=worker) for _ in range(min(max_workers, len(pending)))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    if errors:
+        raise errors[0]
 
 
 # === VERIFICATION ===
@@ -33,7 +136,58 @@ def test_basic():
     assert out == [2, 4, 6]
 
 
+def test_small_inputs_skip_pool():
+    assert parallel_map(lambda x: x + 1, []) == []
+    assert parallel_map(lambda x: x + 1, [1]) == [2]
+    assert parallel_map(lambda x: x + 1, [1, 2], max_workers=1) == [2, 3]
+    assert parallel_map(lambda x: x + 1, iter([1, 2])) == [2, 3]
+
+
+def test_chunked_preserves_order():
+    data = list(range(1000))
+    expected = [x * x for x in data]
+    assert parallel_map(lambda x: x * x, data) == expected
+    assert parallel_map(lambda x: x * x, data, chunksize=7) == expected
+
+
+def test_cpu_variant():
+    data = [-3, -2, -1, 0, 1]
+    assert parallel_map_cpu(abs, data, max_workers=2, chunksize=2) == [3, 2, 1, 0, 1]
+
+
+def test_for_each_visits_every_item():
+    seen = []
+    lock = threading.Lock()
+
+    def record(x):
+        with lock:
+            seen.append(x)
+
+    parallel_for_each(record, range(100))
+    assert sorted(seen) == list(range(100))
+
+
+def test_for_each_rejects_non_positive_workers():
+    for workers in (0, -1):
+        try:
+            parallel_for_each(print, [1], max_workers=workers)
+        except ValueError:
+            pass
+        else:
+            raise AssertionError("max_workers <= 0 was accepted")
+
+
 if __name__ == "__main__":
     test_basic()
     print("✅ test_basic passed")
+    test_small_inputs_skip_pool()
+    print("✅ test_small_inputs_skip_pool passed")
+    test_chunked_preserves_order()
+    print("✅ test_chunked_preserves_order passed")
+    test_cpu_variant()
+    print("✅ test_cpu_variant passed")
+    test_for_each_visits_every_item()
+    print("✅ test_for_each_visits_every_item passed")
+    test_for_each_rejects_non_positive_workers()
+    print("✅ test_for_each_rejects_non_positive_workers passed")
     print("\n🎉 All tests passed!")
@@ -2,34 +2,56 @@
 Solution: rate_limiter
 
 Key Insights:
-1. asyncio.Semaphore gates concurrency; asynccontextmanager simplifies acquire/release.
+1. asyncio.Semaphore gates concurrency and is already an async context manager,
+   so acquire() can hand it out directly instead of wrapping it in a generator.
 2. Using `async with` on the limiter.acquire() ensures release on exceptions.
 3. Keep semaphore per limiter instance to isolate limits.
+4. __aenter__/__aexit__ delegate to the semaphore, so `async with limiter:`
+   works too.
+5. Only the slot counter is guarded; nothing is held while the body awaits, so
+   all N slots make progress instead of queueing behind one sleeper.
+6. BoundedSemaphore turns an accidental extra release into a ValueError
+   rather than silently raising the limit.
+7. The semaphore's bound acquire/release methods are cached in __init__, which
+   saves an attribute lookup on every entry and exit.
 
 Alternative Approaches:
-- Provide __aenter__/__aexit__ directly; this design exposes an acquire helper.
+- Wrap the semaphore with asynccontextmanager; clearer for beginners but it
+  allocates a generator and an extra context manager on every entry.
 """
 
 from __future__ import annotations
 
 import asyncio
-from contextlib import asynccontextmanager
 
 
 # === SOLUTION ===
 
 
 class rate_limiter:
-    def __init__(self, max_concurrent: int):
-        self._sem = asyncio.Semaphore(max_concurrent)
+    """
+    Allow at most ``max_concurrent`` holders at once.
 
-    @asynccontextmanager
-    async def acquire(self):
-        await self._sem.acquire()
-        try:
-            yield
-        finally:
-            self._sem.release()
+    Entering acquires one slot and exiting releases it; no other lock is taken,
+    so up to ``max_concurrent`` bodies may await concurrently. By default an
+    unmatched release raises ValueError; pass ``bounded=False`` to allow it.
+    """
+
+    def __init__(self, max_concurrent: int, bounded: bool = True):
+        sem_cls = asyncio.BoundedSemaphore if bounded else asyncio.Semaphore
+        self._sem = sem_cls(max_concurrent)
+        self._acquire = self._sem.acquire
+        self._release = self._sem.release
+
+    def acquire(self) -> asyncio.Semaphore:
+        return self._sem
+
+    async def __aenter__(self) -> "rate_limiter":
+        await self._acquire()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self._release()
 
 
 # === VERIFICATION ===
@@ -52,11 +74,52 @@ async def test_limits_concurrency():
     assert max_seen <= 2
 
 
+async def test_limiter_is_context_manager():
+    limiter = rate_limiter(1)
+    async with limiter:
+        assert limiter.acquire().locked()
+    assert not limiter.acquire().locked()
+
+
+async def test_all_slots_run_concurrently():
+    n, extra = 3, 4
+    limiter = rate_limiter(n)
+    running = 0
+    max_seen = 0
+
+    async def worker():
+        nonlocal running, max_seen
+        async with limiter:
+            running += 1
+            max_seen = max(max_seen, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+    await asyncio.gather(*(worker() for _ in range(n + extra)))
+    assert max_seen == n
+
+
+def test_over_release_is_rejected():
+    limiter = rate_limiter(1)
+    try:
+        limiter.acquire().release()
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("expected ValueError on over-release")
+
+
 def _run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
     _run(test_limits_concurrency())
     print("✅ test_limits_concurrency passed")
+    _run(test_limiter_is_context_manager())
+    print("✅ test_limiter_is_context_manager passed")
+    _run(test_all_slots_run_concurrently())
+    print("✅ test_all_slots_run_concurrently passed")
+    test_over_release_is_rejected()
+    print("✅ test_over_release_is_rejected passed")
     print("\n🎉 All tests passed!")
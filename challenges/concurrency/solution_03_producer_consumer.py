@@ -2,51 +2,83 @@
 Solution: producer_consumer
 
 Key Insights:
-1. A sentinel signals the consumer to exit cleanly after all items are processed.
-2. queue.task_done/queue.join coordinate completion between threads.
-3. Joining threads prevents premature exit.
+1. deque.append/popleft are atomic in CPython, so items change hands without
+   taking a lock, even with several consumers.
+2. A threading.Condition is used only for idle backoff. A consumer that finds
+   the deque empty registers itself in `waiting` and sleeps in wait() instead
+   of spinning. The producer notifies only when `waiting` is non-zero, and
+   calls notify_all() once at end-of-stream.
+3. No wakeup is lost: a consumer bumps `waiting` before re-checking the deque,
+   and the producer appends before reading `waiting`. Either the consumer
+   sees the new item or the producer sees the waiter.
+4. The result list is pre-sized to len(items) and items travel with their
+   input index, so each consumer writes straight into its own slot. There is
+   no append-driven resizing, no merge step, and input order is kept however
+   many consumers run.
+5. Joining threads prevents premature exit.
 
 Alternative Approaches:
-- Use multiple consumers; same pattern with more threads.
+- queue.Queue with a sentinel per consumer; it blocks the same way, but every
+  put/get takes its lock, updates the unfinished-task count and notifies a
+  Condition. Joining the consumer after it sees the sentinel is enough, and
+  adding task_done/join on top only adds more locking.
+- Per-consumer local lists merged at the end; avoids pre-sizing but needs a
+  sort by index to restore order.
 """
 
 from __future__ import annotations
 
-import queue
 import threading
-from typing import List
+from collections import deque
+from typing import Any, Deque, List, Tuple
 
 
 # === SOLUTION ===
 
 
-def run_pipeline(items) -> List[int]:
-    q: queue.Queue = queue.Queue()
-    sentinel = object()
-    processed: List[int] = []
+def run_pipeline(items, consumers: int = 1) -> List[int]:
+    items = list(items)
+    dq: Deque[Tuple[int, int]] = deque()
+    ready = threading.Condition()
+    waiting = 0
+    done = False
+    processed: List[Any] = [None] * len(items)
 
     def producer():
-        for item in items:
-            q.put(item)
-        q.put(sentinel)
+        nonlocal done
+        for pair in enumerate(items):
+            dq.append(pair)
+            if waiting:
+                with ready:
+                    ready.notify()
+        with ready:
+            done = True
+            ready.notify_all()
 
     def consumer():
+        nonlocal waiting
         while True:
-            item = q.get()
             try:
-                if item is sentinel:
-                    break
-                processed.append(item * 2)
-            finally:
-                q.task_done()
+                idx, item = dq.popleft()
+            except IndexError:
+                with ready:
+                    waiting += 1
+                    while not dq and not done:
+                        ready.wait()
+                    waiting -= 1
+                    if done and not dq:
+                        break
+                continue
+            processed[idx] = item * 2
 
     t_prod = threading.Thread(target=producer)
-    t_cons = threading.Thread(target=consumer)
+    t_cons = [threading.Thread(target=consumer) for _ in range(consumers)]
     t_prod.start()
-    t_cons.start()
+    for t in t_cons:
+        t.start()
     t_prod.join()
-    q.join()
-    t_cons.join()
+    for t in t_cons:
+        t.join()
     return processed
 
 
@@ -58,7 +90,15 @@ def test_pipeline_processes_all():
     assert processed == [2, 4, 6]
 
 
+def test_multiple_consumers():
+    items = list(range(500))
+    expected = [x * 2 for x in items]
+    assert run_pipeline(items, consumers=4) == expected
+
+
 if __name__ == "__main__":
     test_pipeline_processes_all()
     print("✅ test_pipeline_processes_all passed")
+    test_multiple_consumers()
+    print("✅ test_multiple_consumers passed")
     print("\n🎉 All tests passed!")
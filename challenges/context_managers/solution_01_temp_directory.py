@@ -5,6 +5,9 @@ Key Insights:
 1. contextlib.contextmanager simplifies pairing mkdtemp with rmtree.
 2. A try/finally ensures cleanup even when exceptions occur.
 3. Yield the path to allow caller usage inside the with-block.
+4. Temp dirs are usually shallow, so cleanup first unlinks entries found by
+   os.scandir (which caches d_type and avoids extra stat calls) and only
+   recurses with rmtree for subdirectories or on error.
 
 Alternative Approaches:
 - Implement __enter__/__exit__ in a class; same logic with slightly more code.
@@ -21,6 +24,19 @@ from contextlib import contextmanager
 # === SOLUTION ===
 
 
+def _remove_tree(path: str) -> None:
+    try:
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    shutil.rmtree(entry.path)
+                else:
+                    os.unlink(entry.path)
+        os.rmdir(path)
+    except OSError:
+        shutil.rmtree(path, ignore_errors=True)
+
+
 @contextmanager
 def temp_directory():
     path = tempfile.mkdtemp()
@@ -28,7 +44,7 @@ def temp_directory():
         yield path
     finally:
         if os.path.exists(path):
-            shutil.rmtree(path, ignore_errors=True)
+            _remove_tree(path)
 
 
 # === VERIFICATION ===
@@ -42,6 +58,7 @@ def test_creates_and_cleans():
             assert os.path.isdir(path)
             with open(os.path.join(path, "file.txt"), "w", encoding="utf-8") as fh:
                 fh.write("hi")
+            os.makedirs(os.path.join(path, "nested", "deeper"))
     finally:
         if path_seen:
             assert not os.path.exists(path_seen)
@@ -5,15 +5,23 @@ Key Insights:
 1. Swapping sys.stdout to a StringIO buffer captures print output transparently.
 2. Always restore the original stdout in a finally block to avoid leaking state.
 3. Yield the buffer so callers can inspect captured output after the context.
+4. Swapping sys.stdout misses writes that bypass it (C extensions,
+   os.write(1, ...), child processes). redirect_stdout_fd points file
+   descriptor 1 at a temporary file with os.dup2 and copies it into the
+   buffer on exit.
 
 Alternative Approaches:
 - Use contextlib.redirect_stdout internally; this solution shows manual control.
+- Redirect fd 1 into an os.pipe; reading only on exit can deadlock once the
+  pipe buffer fills, which is why a temporary file is used instead.
 """
 
 from __future__ import annotations
 
 import io
+import os
 import sys
+import tempfile
 from contextlib import contextmanager
 
 
@@ -31,6 +39,24 @@ def redirect_stdout_to_buffer():
         sys.stdout = original
 
 
+@contextmanager
+def redirect_stdout_fd():
+    buffer = io.StringIO()
+    stdout_fd = 1
+    sys.stdout.flush()
+    saved_fd = os.dup(stdout_fd)
+    with tempfile.TemporaryFile(mode="w+b") as tmp:
+        os.dup2(tmp.fileno(), stdout_fd)
+        try:
+            yield buffer
+        finally:
+            sys.stdout.flush()
+            os.dup2(saved_fd, stdout_fd)
+            os.close(saved_fd)
+            tmp.seek(0)
+            buffer.write(tmp.read().decode(errors="replace"))
+
+
 # === VERIFICATION ===
 
 
@@ -52,9 +78,17 @@ def test_restores_stdout_on_exception():
     assert sys.stdout is original
 
 
+def test_fd_redirect_captures_raw_writes():
+    with redirect_stdout_fd() as buf:
+        os.write(1, b"raw\n")
+    assert buf.getvalue() == "raw\n"
+
+
 if __name__ == "__main__":
     test_captures_output()
     print("✅ test_captures_output passed")
     test_restores_stdout_on_exception()
     print("✅ test_restores_stdout_on_exception passed")
+    test_fd_redirect_captures_raw_writes()
+    print("✅ test_fd_redirect_captures_raw_writes passed")
     print("\n🎉 All tests passed!")
@@ -5,6 +5,9 @@ Key Insights:
 1. Snapshot the dict on entry so rollback can simply replace contents.
 2. __exit__ sees exception info; restore and return False to re-raise.
 3. Using dict.clear/update avoids replacing the original object reference.
+4. dict.copy is the cheapest snapshot (a C-level table copy, far faster than
+   tuple(store.items())); the snapshot is dropped on exit so it is not kept
+   alive after the block.
 
 Alternative Approaches:
 - Manage deep copies for nested data if required; shallow suffices here.
@@ -30,8 +33,8 @@ class transaction:
         if exc_type is not None:
             self.store.clear()
             self.store.update(self.snapshot)
-            return False  # re-raise
-        return False
+        self.snapshot = None
+        return False  # re-raise
 
 
 # === VERIFICATION ===
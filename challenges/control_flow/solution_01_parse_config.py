@@ -2,11 +2,13 @@
 Solution: parse_config
 
 Key Insights:
-1. Structural pattern matching on dicts keeps branching concise.
-2. Order patterns from specific to general; fallback with case _.
+1. Read the discriminating key once with config.get("mode") and branch on it.
+2. Check the specific cases first and fall back to "unknown".
+3. Straight-line branches compile to fewer bytecodes than MATCH_MAPPING
+   patterns, which matters when parse_config is called in a hot loop.
 
 Alternative Approaches:
-- Plain if/elif; match is clearer for structured keys.
+- Structural pattern matching on the dict; more declarative for nested shapes.
 """
 
 from __future__ import annotations
@@ -16,13 +18,12 @@ from __future__ import annotations
 
 
 def parse_config(config: dict) -> str:
-    match config:
-        case {"mode": "dev"}:
-            return "development"
-        case {"mode": "prod", "region": region}:
-            return f"prod-{region}"
-        case _:
-            return "unknown"
+    mode = config.get("mode")
+    if mode == "dev":
+        return "development"
+    if mode == "prod" and "region" in config:
+        return f"prod-{config['region']}"
+    return "unknown"
 
 
 # === VERIFICATION ===
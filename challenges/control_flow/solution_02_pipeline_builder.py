@@ -3,38 +3,48 @@ Solution: pipeline_builder
 
 Key Insights:
 1. Treat pipeline steps as immutable; each map/filter returns a new Pipeline with copied steps.
-2. run composes steps by applying them sequentially to the iterable.
-3. Using generator expressions keeps evaluation lazy.
+2. Steps are stored as ("map", fn) / ("filter", pred) pairs rather than as
+   generator factories.
+3. run chains the built-in map and filter, whose per-item loop runs in C
+   with no Python generator frame in between steps.
+4. map and filter are lazy iterators, so evaluation stays lazy.
 
 Alternative Approaches:
 - Mutate self steps; immutability is safer for reuse.
+- Wrap each step in its own generator expression; simpler, but every extra
+  step adds a Python-level generator frame per item.
+- Fuse all steps into one hand-written generator; one frame, but the step
+  dispatch still runs in Python bytecode.
 """
 
 from __future__ import annotations
 
-from typing import Callable, Iterable, List
+from typing import Callable, Iterable, Iterator, List, Tuple
 
 
 # === SOLUTION ===
 
 
+Step = Tuple[str, Callable]
+
+
 class Pipeline:
     def __init__(self, steps=None):
-        self.steps: List[Callable[[Iterable], Iterable]] = steps or []
+        self.steps: List[Step] = steps or []
 
-    def _clone(self, step: Callable[[Iterable], Iterable]):
+    def _clone(self, step: Step):
         return Pipeline(self.steps + [step])
 
     def map(self, fn: Callable):
-        return self._clone(lambda data: (fn(x) for x in data))
+        return self._clone(("map", fn))
 
     def filter(self, pred: Callable):
-        return self._clone(lambda data: (x for x in data if pred(x)))
+        return self._clone(("filter", pred))
 
-    def run(self, data: Iterable):
-        result = data
-        for step in self.steps:
-            result = step(result)
+    def run(self, data: Iterable) -> Iterator:
+        result: Iterator = iter(data)
+        for kind, f in self.steps:
+            result = map(f, result) if kind == "map" else filter(f, result)
         return result
 
 
@@ -2,21 +2,30 @@
 Solution: state_machine
 
 Key Insights:
-1. match/case on (state, event) keeps transition logic compact.
+1. A class-level dict maps (state, event) to the next state, so send is one
+   hash lookup instead of a chain of pattern comparisons.
 2. State is updated then returned for convenience.
-3. Unhandled events leave the state unchanged.
+3. Unhandled events leave the state unchanged via dict.get's default.
 
 Alternative Approaches:
-- Use a transition dict mapping (state, event) to next state.
+- match/case on (state, event); compact, but each case is tried in order.
 """
 
 from __future__ import annotations
 
+from typing import Dict, Tuple
+
 
 # === SOLUTION ===
 
 
 class FSM:
+    _TRANSITIONS: Dict[Tuple[str, str], str] = {
+        ("idle", "start"): "running",
+        ("running", "stop"): "stopped",
+        ("stopped", "reset"): "idle",
+    }
+
     def __init__(self, initial_state="idle"):
         self._state = initial_state
 
@@ -25,15 +34,7 @@ class FSM:
         return self._state
 
     def send(self, event: str) -> str:
-        match (self._state, event):
-            case ("idle", "start"):
-                self._state = "running"
-            case ("running", "stop"):
-                self._state = "stopped"
-            case ("stopped", "reset"):
-                self._state = "idle"
-            case _:
-                pass
+        self._state = self._TRANSITIONS.get((self._state, event), self._state)
         return self._state
 
 
@@ -2,42 +2,78 @@
 Solution: lru_dict
 
 Key Insights:
-1. OrderedDict.move_to_end tracks recency on both get and set.
-2. When exceeding max_size, popitem(last=False) evicts the least recent entry.
-3. Separate get/set methods make intent explicit without subclassing dict.
+1. Plain dicts keep insertion order (3.7+), so recency can be tracked by
+   popping a key and reinserting it at the end on both get and set.
+2. The least recent entry is the first key, next(iter(self._data)); deleting
+   it enforces max_size.
+3. A plain dict has no per-entry linked-list node, so it uses roughly half the
+   memory of an OrderedDict and is faster on hit-heavy access.
+4. get pops with a private sentinel default, so a hit costs one lookup
+   instead of a membership test plus a pop; None stays a valid stored value.
+5. The most recently used key is remembered, so repeated access to it skips
+   the pop/reinsert entirely; it is already at the end.
+6. evict_matching walks the dict's own iterator from least to most recent, so
+   finding the first evictable key needs no list(self._data) copy. Deleting
+   is safe because the method returns before the iterator advances again.
+7. __slots__ drops the per-instance __dict__ and makes attribute access a
+   fixed-offset load, which helps when many small caches exist.
+8. Separate get/set methods make intent explicit without subclassing dict.
 
 Alternative Approaches:
+- OrderedDict with move_to_end/popitem(last=False); better when nearly every
+  set evicts, because deleting from the front of a plain dict leaves holes
+  that next(iter(...)) must skip until the table is resized.
 - Subclass OrderedDict and override __getitem__/__setitem__.
 - Use a deque plus dict for manual tracking.
+- A compiled LRU (e.g. the lru-dict C extension, or Cython with a key->slot
+  dict and int prev/next arrays) is several times faster again, at the cost
+  of a build step and a native dependency.
 """
 
 from __future__ import annotations
 
-from collections import OrderedDict
-from typing import Any
+from typing import Any, Callable, Dict
 
 
 # === SOLUTION ===
 
 
+_MISSING = object()
+
+
 class LRUDict:
+    __slots__ = ("max_size", "_data", "_mru")
+
     def __init__(self, max_size: int):
         self.max_size = max_size
-        self._data: OrderedDict[Any, Any] = OrderedDict()
+        self._data: Dict[Any, Any] = {}
+        self._mru: Any = _MISSING
 
     def get(self, key, default=None):
-        if key not in self._data:
+        if key == self._mru:
+            return self._data.get(key, default)
+        value = self._data.pop(key, _MISSING)
+        if value is _MISSING:
             return default
-        value = self._data.pop(key)
         self._data[key] = value  # move to end
+        self._mru = key
         return value
 
     def set(self, key, value):
-        if key in self._data:
-            self._data.pop(key)
+        if key != self._mru:
+            self._data.pop(key, None)
+            self._mru = key
         self._data[key] = value
         if len(self._data) > self.max_size:
-            self._data.popitem(last=False)
+            del self._data[next(iter(self._data))]
+
+    def evict_matching(self, pred: Callable[[Any], bool]):
+        """Evict the least recently used key satisfying pred and return it."""
+        for key in self._data:
+            if pred(key):
+                del self._data[key]
+                return key
+        return None
 
 
 # === VERIFICATION ===
@@ -60,9 +96,34 @@ def test_eviction_order():
     assert cache.get("c") == 3
 
 
+def test_repeated_access_keeps_order():
+    cache = LRUDict(2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("b")
+    cache.set("b", 20)
+    cache.set("c", 3)  # should evict a
+    assert cache.get("a") is None
+    assert cache.get("b") == 20
+
+
+def test_evict_matching_skips_pinned():
+    cache = LRUDict(3)
+    for key in ("pinned", "a", "b"):
+        cache.set(key, key)
+    assert cache.evict_matching(lambda k: k != "pinned") == "a"
+    assert cache.get("a") is None
+    assert cache.get("pinned") == "pinned"
+    assert cache.evict_matching(lambda k: False) is None
+
+
 if __name__ == "__main__":
     test_basic_set_get()
     print("✅ test_basic_set_get passed")
     test_eviction_order()
     print("✅ test_eviction_order passed")
+    test_repeated_access_keeps_order()
+    print("✅ test_repeated_access_keeps_order passed")
+    test_evict_matching_skips_pinned()
+    print("✅ test_evict_matching_skips_pinned passed")
     print("\n🎉 All tests passed!")
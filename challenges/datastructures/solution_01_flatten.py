@@ -2,31 +2,49 @@
 Solution: flatten
 
 Key Insights:
-1. Recursing on list elements and extending the result preserves order.
-2. Avoid mutating the input; build a new output list.
-3. Base case: non-list items append directly.
+1. An explicit stack of iterators replaces recursion, so there is no Python
+   call per nested list and no temporary list per level to extend from.
+2. Avoid mutating the input. flatten_iter yields leaves lazily, so callers
+   that only iterate (sum, any, a for loop) need no output list at all;
+   flatten simply materializes it.
+3. On meeting a nested list, push its iterator and break; when an iterator is
+   exhausted, pop it and resume the parent where it left off, keeping order.
+4. type(item) is list is a pointer compare, well under half the cost of
+   isinstance for scalar leaves. The input is specified as ints and plain
+   lists, so list subclasses are deliberately treated as leaves.
 
 Alternative Approaches:
-- Use an explicit stack to avoid recursion depth concerns.
+- Recurse on list elements and extend the result; shorter, but it pays a call
+  and a temporary list per level and is bounded by the recursion limit.
+- JIT-compile with Numba's @njit; ragged nested lists have no native type, so
+  the input must first be copied into numba.typed.List, which costs about as
+  much as flattening it in Python. Only worthwhile if data already lives in
+  typed containers.
 """
 
 from __future__ import annotations
 
-from typing import List, Any
+from typing import Any, Iterator, List
 
 
 # === SOLUTION ===
 
 
-def flatten(nested) -> List[Any]:
-    out: List[Any] = []
+def flatten_iter(nested) -> Iterator[Any]:
+    stack = [iter(nested)]
 
-    for item in nested:
-        if isinstance(item, list):
-            out.extend(flatten(item))
+    while stack:
+        for item in stack[-1]:
+            if type(item) is list:
+                stack.append(iter(item))
+                break
+            yield item
         else:
-            out.append(item)
-    return out
+            stack.pop()
+
+
+def flatten(nested) -> List[Any]:
+    return list(flatten_iter(nested))
 
 
 # === VERIFICATION ===
@@ -40,9 +58,36 @@ def test_deep_empty():
     assert flatten([[], [1, [2, []]], 3]) == [1, 2, 3]
 
 
+def test_deeper_than_recursion_limit():
+    nested: List[Any] = [0]
+    for _ in range(5000):
+        nested = [nested]
+    assert flatten(nested) == [0]
+
+
+def test_iter_is_lazy():
+    leaves = flatten_iter([1, [2, [3]]])
+    assert next(leaves) == 1
+    assert sum(leaves) == 5
+
+
+def test_list_subclass_is_a_leaf():
+    class Row(list):
+        pass
+
+    row = Row([1, 2])
+    assert flatten([row, [3]]) == [row, 3]
+
+
 if __name__ == "__main__":
     test_basic()
     print("✅ test_basic passed")
     test_deep_empty()
     print("✅ test_deep_empty passed")
+    test_deeper_than_recursion_limit()
+    print("✅ test_deeper_than_recursion_limit passed")
+    test_iter_is_lazy()
+    print("✅ test_iter_is_lazy passed")
+    test_list_subclass_is_a_leaf()
+    print("✅ test_list_subclass_is_a_leaf passed")
     print("\n🎉 All tests passed!")
@@ -2,28 +2,57 @@
 Solution: group_by
 
 Key Insights:
-1. dict.setdefault keeps code concise while preserving insertion order in Python 3.7+.
+1. defaultdict(list) creates a group only on the first miss (in C), while
+   setdefault(key, []) builds a throwaway list on every call.
 2. Avoid mutating inputs; build a new dictionary.
 3. Call key_func once per item to prevent double work.
+4. Converting back with dict() keeps insertion order (Python 3.7+) and stops
+   callers from silently creating groups by reading missing keys.
+5. When there are exactly two groups, group_by_binary splits on a predicate
+   into two lists and never hashes a key.
 
 Alternative Approaches:
-- collections.defaultdict(list) with a simple loop.
+- dict.setdefault(key, []).append(item); concise, one extra list per item.
+- Cache a bound list.append per key in a side dict to skip the attribute
+  lookup; on CPython 3.11+ the adaptive interpreter already specializes that
+  lookup, and the extra dict probe makes it slower than defaultdict.
+- For large numeric NumPy arrays, compute all keys with one ufunc, then
+  np.unique(keys, return_inverse=True) plus a stable argsort and np.split
+  yields the groups without a Python-level loop. It only pays off when the
+  input already is an ndarray and key_func can be vectorized.
+- Stable-sort the items by key and run itertools.groupby over them. Sorting
+  and groupby run in C, but the O(n log n) sort, the need for orderable keys
+  and the extra pass to restore first-seen order make it slower than the
+  single O(n) defaultdict pass.
 """
 
 from __future__ import annotations
 
-from typing import Any, Callable, Dict, List
+from collections import defaultdict
+from typing import Any, Callable, DefaultDict, Dict, List, Tuple
 
 
 # === SOLUTION ===
 
 
 def group_by(items, key_func: Callable[[Any], Any]) -> Dict[Any, List[Any]]:
-    grouped: Dict[Any, List[Any]] = {}
+    grouped: DefaultDict[Any, List[Any]] = defaultdict(list)
     for item in items:
-        key = key_func(item)
-        grouped.setdefault(key, []).append(item)
-    return grouped
+        grouped[key_func(item)].append(item)
+    return dict(grouped)
+
+
+def group_by_binary(items, pred: Callable[[Any], Any]) -> Tuple[List[Any], List[Any]]:
+    matched: List[Any] = []
+    rest: List[Any] = []
+    add_matched = matched.append
+    add_rest = rest.append
+    for item in items:
+        if pred(item):
+            add_matched(item)
+        else:
+            add_rest(item)
+    return matched, rest
 
 
 # === VERIFICATION ===
@@ -41,9 +70,17 @@ def test_order_preserved():
     assert list(grouped.keys()) == ["a", "b"]
 
 
+def test_binary_split():
+    evens, odds = group_by_binary([1, 2, 3, 4, 5], lambda x: x % 2 == 0)
+    assert evens == [2, 4]
+    assert odds == [1, 3, 5]
+
+
 if __name__ == "__main__":
     test_groups_numbers()
     print("✅ test_groups_numbers passed")
     test_order_preserved()
     print("✅ test_order_preserved passed")
+    test_binary_split()
+    print("✅ test_binary_split passed")
     print("\n🎉 All tests passed!")
@@ -82,7 +82,7 @@ async def test_shared_inflight():
 
 
 def _run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
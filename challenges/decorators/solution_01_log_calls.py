@@ -4,7 +4,13 @@ Solution: log_calls
 Key Insights:
 1. functools.wraps preserves metadata so decorated functions remain transparent.
 2. The wrapper must forward *args/**kwargs and return the underlying result.
-3. A simple print statement before invocation satisfies the logging requirement.
+3. The "CALL name args=" prefix is built once at decoration time; each call
+   writes a single string with sys.stdout.write, skipping print's sep/end
+   handling and its second write for the newline.
+4. sys.stdout is looked up on every call, not cached, so redirect_stdout
+   still captures the output.
+5. Setting LOG_ENABLED = False turns logging off without re-decorating; the
+   message is then never formatted.
 
 Alternative Approaches:
 - Use logging module instead of print; capture the same message format.
@@ -13,6 +19,7 @@ Alternative Approaches:
 
 from __future__ import annotations
 
+import sys
 from functools import wraps
 from typing import Any, Callable
 
@@ -20,10 +27,16 @@ from typing import Any, Callable
 # === SOLUTION ===
 
 
+LOG_ENABLED = True
+
+
 def log_calls(fn: Callable) -> Callable:
+    prefix = f"CALL {fn.__name__} args="
+
     @wraps(fn)
     def wrapper(*args: Any, **kwargs: Any):
-        print(f"CALL {fn.__name__} args={args} kwargs={kwargs}")
+        if LOG_ENABLED:
+            sys.stdout.write(f"{prefix}{args!r} kwargs={kwargs!r}\n")
         return fn(*args, **kwargs)
 
     return wrapper
@@ -2,12 +2,19 @@
 Solution: validate_args
 
 Key Insights:
-1. inspect.signature().bind_partial binds provided args to parameter names, handling defaults and keywords uniformly.
-2. Validating against a types mapping allows clear TypeError messages per argument.
-3. functools.wraps preserves metadata for decorated functions.
+1. inspect.signature is read once, at decoration time, to record where each
+   validated argument can appear: its positional index and whether it may be
+   passed by keyword.
+2. Each call then checks only the validated names with tuple/dict lookups,
+   instead of running Signature.bind_partial over every parameter.
+3. Validating against a types mapping allows clear TypeError messages per argument.
+4. *args/**kwargs parameters have no fixed slot, so validating them falls back
+   to bind_partial.
+5. functools.wraps preserves metadata for decorated functions.
 
 Alternative Approaches:
-- Manually map positional indices to names, but binding is less error-prone.
+- Call sig.bind_partial on every invocation; simplest, but it walks all
+  parameters in Python on each call.
 - Accept tuples of types to allow multiple valid types per argument.
 """
 
@@ -15,24 +22,61 @@ from __future__ import annotations
 
 import inspect
 from functools import wraps
-from typing import Any, Callable, Mapping
+from typing import Any, Callable, List, Mapping, Optional, Tuple
 
 
 # === SOLUTION ===
 
 
+_POSITIONAL = (inspect.Parameter.POSITIONAL_ONLY, inspect.Parameter.POSITIONAL_OR_KEYWORD)
+_VARIADIC = (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+
+
 def validate_args(types: Mapping[str, type]):
     def decorator(fn: Callable):
         sig = inspect.signature(fn)
+        params = sig.parameters
+
+        if any(name in params and params[name].kind in _VARIADIC for name in types):
+
+            @wraps(fn)
+            def bound_wrapper(*args: Any, **kwargs: Any):
+                bound = sig.bind_partial(*args, **kwargs)
+                for name, expected in types.items():
+                    if name in bound.arguments:
+                        if not isinstance(bound.arguments[name], expected):
+                            raise TypeError(f"Argument {name} must be {expected}")
+                return fn(*args, **kwargs)
+
+            return bound_wrapper
+
+        positions = {
+            name: index
+            for index, (name, param) in enumerate(params.items())
+            if param.kind in _POSITIONAL
+        }
+        checks: List[Tuple[str, Optional[int], bool, type]] = [
+            (
+                name,
+                positions.get(name),
+                params[name].kind is not inspect.Parameter.POSITIONAL_ONLY,
+                expected,
+            )
+            for name, expected in types.items()
+            if name in params
+        ]
 
         @wraps(fn)
         def wrapper(*args: Any, **kwargs: Any):
-            bound = sig.bind_partial(*args, **kwargs)
-            for name, expected in types.items():
-                if name in bound.arguments:
-                    value = bound.arguments[name]
-                    if not isinstance(value, expected):
-                        raise TypeError(f"Argument {name} must be {expected}")
+            for name, index, by_keyword, expected in checks:
+                if index is not None and index < len(args):
+                    value = args[index]
+                elif by_keyword and name in kwargs:
+                    value = kwargs[name]
+                else:
+                    continue
+                if not isinstance(value, expected):
+                    raise TypeError(f"Argument {name} must be {expected}")
             return fn(*args, **kwargs)
 
         return wrapper
@@ -64,6 +108,26 @@ def test_invalid_keyword():
         raise AssertionError("TypeError not raised")
 
 
+def test_keyword_only_and_variadic():
+    @validate_args({"flag": bool})
+    def configure(name, *, flag=False):
+        return name, flag
+
+    assert configure("a", flag=True) == ("a", True)
+    try:
+        configure("a", flag="yes")
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("TypeError not raised")
+
+    @validate_args({"rest": tuple})
+    def collect(*rest):
+        return rest
+
+    assert collect(1, 2) == (1, 2)
+
+
 def test_preserves_metadata():
     @validate_args({"x": int})
     def square(x):
@@ -80,6 +144,8 @@ if __name__ == "__main__":
     print("✅ test_valid_positional passed")
     test_invalid_keyword()
     print("✅ test_invalid_keyword passed")
+    test_keyword_only_and_variadic()
+    print("✅ test_keyword_only_and_variadic passed")
     test_preserves_metadata()
     print("✅ test_preserves_metadata passed")
     print("\n🎉 All tests passed!")
@@ -3,39 +3,73 @@ Solution: memoize_async
 
 Key Insights:
 1. Caching the asyncio.Task lets concurrent callers await the same in-flight work.
-2. The cache key must be deterministic; sorting kwargs ensures hashable order.
-3. wraps preserves metadata; raising on non-async input prevents silent misuse.
+2. The cache key must be deterministic. All-positional calls use args as the
+   key directly. Otherwise kwargs are appended as a frozenset after a private
+   marker, which ignores keyword order without sorting, and the marker keeps
+   them from colliding with positional arguments.
+3. A done-callback evicts tasks that were cancelled or raised, so the next
+   call retries them. A cache hit is a plain dict lookup with no
+   task.done()/cancelled() checks.
+4. The cache is an LRU bounded by max_size (None for unbounded). Only finished
+   tasks are evicted, so in-flight work stays shared even when the cache is
+   briefly over its limit. Each miss and each finished task trims the oldest
+   finished entries until the cache is back within max_size.
+5. The cache is exposed as wrapper.cache for inspection.
+6. wraps preserves metadata; raising on non-async input prevents silent misuse.
 
 Alternative Approaches:
 - Cache raw results instead of tasks but add a lock to prevent duplicate work.
 - Add TTL eviction if staleness matters.
+- functools.lru_cache over the coroutine function caches coroutine objects,
+  which can only be awaited once; caching tasks avoids that trap.
 """
 
 from __future__ import annotations
 
 import asyncio
-from functools import wraps
-from typing import Any, Callable, Dict, Tuple
+from collections import OrderedDict
+from functools import partial, wraps
+from typing import Any, Callable, Optional, Tuple
 
 
 # === SOLUTION ===
 
 
-def memoize_async(fn: Callable):
+def memoize_async(fn: Optional[Callable] = None, *, max_size: Optional[int] = 1024):
+    if fn is None:
+        return partial(memoize_async, max_size=max_size)
     if not asyncio.iscoroutinefunction(fn):
         raise TypeError("memoize_async can only wrap async functions")
 
-    cache: Dict[Tuple[Any, ...], asyncio.Task] = {}
+    cache: OrderedDict[Tuple[Any, ...], asyncio.Task] = OrderedDict()
+    kwargs_mark = object()
+
+    def trim() -> None:
+        if max_size is None or len(cache) <= max_size:
+            return
+        for key in [key for key, task in cache.items() if task.done()]:
+            del cache[key]
+            if len(cache) <= max_size:
+                return
+
+    def on_done(key: Tuple[Any, ...], task: asyncio.Task) -> None:
+        if (task.cancelled() or task.exception() is not None) and cache.get(key) is task:
+            del cache[key]
+        trim()
 
     @wraps(fn)
     async def wrapper(*args: Any, **kwargs: Any):
-        key = args + (tuple(sorted(kwargs.items())),)
+        key = args + (kwargs_mark, frozenset(kwargs.items())) if kwargs else args
         task = cache.get(key)
-        if task is None or task.done() and task.cancelled():
-            task = asyncio.create_task(fn(*args, **kwargs))
-            cache[key] = task
+        if task is None:
+            task = cache[key] = asyncio.create_task(fn(*args, **kwargs))
+            task.add_done_callback(partial(on_done, key))
+            trim()
+        else:
+            cache.move_to_end(key)
         return await task
 
+    wrapper.cache = cache  # type: ignore[attr-defined]
     return wrapper
 
 
@@ -76,8 +110,74 @@ async def test_shared_inflight():
     assert calls["count"] == 1
 
 
+async def test_kwargs_order_insensitive():
+    calls = {"count": 0}
+
+    @memoize_async
+    async def combine(a, b=0, c=0):
+        calls["count"] += 1
+        return a + b + c
+
+    assert await combine(1, b=2, c=3) == 6
+    assert await combine(1, c=3, b=2) == 6
+    assert calls["count"] == 1
+    assert await combine(1) == 1
+    assert calls["count"] == 2
+
+
+async def test_failures_are_retried():
+    calls = {"count": 0}
+
+    @memoize_async
+    async def flaky(x):
+        calls["count"] += 1
+        if calls["count"] == 1:
+            raise RuntimeError("transient")
+        return x
+
+    try:
+        await flaky(1)
+    except RuntimeError:
+        pass
+    assert await flaky(1) == 1
+    assert await flaky(1) == 1
+    assert calls["count"] == 2
+
+
+async def test_bounded_cache_evicts_lru():
+    calls = {"count": 0}
+
+    @memoize_async(max_size=2)
+    async def ident(x):
+        calls["count"] += 1
+        return x
+
+    await ident(1)
+    await ident(2)
+    await ident(1)  # 1 becomes most recent
+    await ident(3)  # evicts 2
+    assert calls["count"] == 3
+    await ident(1)
+    assert calls["count"] == 3
+    await ident(2)
+    assert calls["count"] == 4
+
+
+async def test_bounded_cache_recovers_after_burst():
+    @memoize_async(max_size=2)
+    async def slow_id(x):
+        await asyncio.sleep(0.01)
+        return x
+
+    await asyncio.gather(*(slow_id(i) for i in range(10)))
+    assert len(slow_id.cache) <= 2
+    for i in range(10, 30):
+        await slow_id(i)
+    assert len(slow_id.cache) <= 2
+
+
 def _run(coro):
-    return asyncio.get_event_loop().run_until_complete(coro)
+    return asyncio.run(coro)
 
 
 if __name__ == "__main__":
@@ -85,4 +185,12 @@ if __name__ == "__main__":
     print("✅ test_caches_result passed")
     _run(test_shared_inflight())
     print("✅ test_shared_inflight passed")
+    _run(test_kwargs_order_insensitive())
+    print("✅ test_kwargs_order_insensitive passed")
+    _run(test_failures_are_retried())
+    print("✅ test_failures_are_retried passed")
+    _run(test_bounded_cache_evicts_lru())
+    print("✅ test_bounded_cache_evicts_lru passed")
+    _run(test_bounded_cache_recovers_after_burst())
+    print("✅ test_bounded_cache_recovers_after_burst passed")
     print("\n🎉 All tests passed!")
@@ -4,10 +4,16 @@ Solution: compose
 Key Insights:
 1. Reduce right-to-left by iterating reversed function list.
 2. Returning identity when no functions are given keeps API predictable.
-3. Inner function captures *fns via closure.
+3. For up to _MAX_INLINE functions, compose builds a straight-line lambda such
+   as `lambda x: f0(f1(x))` with eval. Each call is then just the nested calls,
+   with no loop, reversed() iterator or closure lookups.
+4. The functions live only in the eval globals, so the signature stays `(x)`
+   and extra arguments raise TypeError. The generated source contains only
+   names made here, never user input.
 
 Alternative Approaches:
 - Use functools.reduce; explicit loop is clear.
+- Always loop over reversed(fns); simpler, but every call pays the loop.
 """
 
 from __future__ import annotations
@@ -18,10 +24,20 @@ from typing import Callable, Any
 # === SOLUTION ===
 
 
+_MAX_INLINE = 4
+
+
 def compose(*fns: Callable) -> Callable:
     if not fns:
         return lambda x: x
 
+    if len(fns) <= _MAX_INLINE:
+        names = [f"f{i}" for i in range(len(fns))]
+        body = "x"
+        for name in reversed(names):
+            body = f"{name}({body})"
+        return eval(f"lambda x: {body}", dict(zip(names, fns)))
+
     def inner(value: Any):
         result = value
         for fn in reversed(fns):
@@ -46,9 +62,29 @@ def test_identity():
     assert f(5) == 5
 
 
+def test_compose_rejects_extra_args():
+    f = compose(lambda x: x + 1, lambda x: x * 2)
+    try:
+        f(3, print)
+    except TypeError:
+        pass
+    else:
+        raise AssertionError("extra positional argument was accepted")
+
+
+def test_compose_many():
+    fns = [lambda x, i=i: x * 10 + i for i in range(6)]
+    for n in range(1, 7):
+        assert compose(*fns[:n])(0) == int("".join(str(i) for i in reversed(range(n))))
+
+
 if __name__ == "__main__":
     test_compose_two()
     print("✅ test_compose_two passed")
     test_identity()
     print("✅ test_identity passed")
+    test_compose_rejects_extra_args()
+    print("✅ test_compose_rejects_extra_args passed")
+    test_compose_many()
+    print("✅ test_compose_many passed")
     print("\n🎉 All tests passed!")
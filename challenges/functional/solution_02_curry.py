@@ -2,24 +2,35 @@
 Solution: curry
 
 Key Insights:
-1. Use signature to know how many positional parameters are expected.
+1. Use signature once, at decoration time, to know how many positional
+   parameters are expected.
 2. Collect args incrementally; when enough are present, call the original.
-3. Return another curried function when args are still missing.
+3. Missing arguments yield a functools.partial over a module-level helper
+   rather than a fresh nested closure. The partial object is built and
+   called in C.
 
 Alternative Approaches:
-- Use functools.partial; here we demonstrate manual accumulation.
+- Return a new inner closure per partial call; same behaviour, more Python
+  frames and a closure allocation per step.
 """
 
 from __future__ import annotations
 
-from functools import wraps
+from functools import partial, wraps
 from inspect import signature
-from typing import Any, Callable
+from typing import Any, Callable, Tuple
 
 
 # === SOLUTION ===
 
 
+def _accumulate(fn: Callable, arity: int, args: Tuple[Any, ...], *more: Any):
+    args += more
+    if len(args) >= arity:
+        return fn(*args)
+    return partial(_accumulate, fn, arity, args)
+
+
 def curry(fn: Callable) -> Callable:
     arity = len(signature(fn).parameters)
 
@@ -27,11 +38,7 @@ def curry(fn: Callable) -> Callable:
     def curried(*args: Any):
         if len(args) >= arity:
             return fn(*args)
-
-        def next_call(*more):
-            return curried(*args, *more)
-
-        return next_call
+        return partial(_accumulate, fn, arity, args)
 
     return curried
 
@@ -46,6 +53,11 @@ def test_basic():
 
     assert add3(1)(2)(3) == 6
     assert add3(1, 2)(3) == 6
+    assert add3(1)(2, 3) == 6
+
+    step = add3(1)
+    assert step(2)(3) == 6
+    assert step(10)(20) == 31
 
 
 if __name__ == "__main__":
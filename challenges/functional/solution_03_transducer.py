@@ -6,58 +6,126 @@ Key Insights:
    forwarding (filter).
 2. compose_transforms applies transforms right-to-left so the first argument is
    the outermost transformation.
-3. transduce runs the composed reducer over the data, threading the accumulator.
+3. transduce builds the composed reducer once, then lets functools.reduce
+   thread the accumulator through it in C.
+4. mapping/filtering bind fn, pred and the downstream reducer as default
+   arguments, so the per-item step reads fast locals rather than closure cells.
+5. mapping/filtering also record what they do in an `ops` attribute. When every
+   transform in a composition is tagged, compose_transforms generates one
+   function whose loop body inlines all the steps. Each item then costs one
+   call per user function instead of an extra reducer frame per transform.
+   Untagged, hand-written transforms still use the closure chain.
+6. Compositions are memoized on the tuple of transform objects in a
+   WeakValueDictionary. Composing the same transforms again while an earlier
+   composition is still alive reuses it and its generated code, but the cache
+   never keeps a composition (or the closures it captures) alive by itself.
+   Unhashable transforms skip the cache and are composed fresh.
 
 Alternative Approaches:
 - Chain generator expressions; transducers keep data flow reducer-driven.
+- For numeric arrays with ufunc-friendly steps, NumPy can apply each map as an
+  array expression and each filter as a boolean mask (arr = arr[pred(arr)]).
+  That only works when every user function accepts whole arrays, which
+  arbitrary lambdas and reducers do not guarantee.
+- Numba's @njit can compile the fused loop when the data is a typed array and
+  every step is itself an @njit function. Plain Python lambdas and list
+  reducers cannot be passed in, so it suits fixed numeric kernels rather than
+  a general transducer API.
+- Collect into a pre-sized [None] * n buffer with a write index instead of
+  list.append. The index must live in a closure cell or object attribute,
+  and updating it costs more than append's amortized growth, so the plain
+  appending reducer stays faster.
 """
 
 from __future__ import annotations
 
-from typing import Callable, Iterable, Any
+from functools import reduce
+from typing import Any, Callable, Iterable, Optional, Sequence, Tuple
+from weakref import WeakValueDictionary
 
 
 # === SOLUTION ===
 
 
-def compose_transforms(*transforms):
+Op = Tuple[str, Callable]
+
+
+def _fuse(ops: Sequence[Op]) -> Callable:
+    names = [f"f{i}" for i in range(len(ops))]
+    lines = ["    for v in data:"]
+    for (kind, _), name in zip(ops, names):
+        if kind == "map":
+            lines.append(f"        v = {name}(v)")
+        else:
+            lines.append(f"        if not {name}(v):")
+            lines.append("            continue")
+    lines.append("        acc = reducer(acc, v)")
+    lines.append("    return acc")
+    params = "".join(f", {name}={name}" for name in names)
+    src = f"def fused(data, reducer, acc{params}):\n" + "\n".join(lines)
+    namespace = {name: fn for (_, fn), name in zip(ops, names)}
+    exec(compile(src, "<fused transducer>", "exec"), namespace)
+    return namespace["fused"]
+
+
+_compositions: WeakValueDictionary = WeakValueDictionary()
+
+
+def _compose(transforms: Tuple[Callable, ...]) -> Callable:
+    inner_first = transforms[::-1]
+
     def composed(reducer):
         wrapped = reducer
-        for xf in reversed(transforms):
+        for xf in inner_first:
             wrapped = xf(wrapped)
         return wrapped
 
+    op_lists = [getattr(xf, "ops", None) for xf in transforms]
+    if all(ops is not None for ops in op_lists):
+        composed.ops = tuple(op for ops in op_lists for op in ops)
+        composed.fused = _fuse(composed.ops)
+    return composed
+
+
+def compose_transforms(*transforms):
+    try:
+        return _compositions[transforms]
+    except KeyError:
+        composed = _compositions[transforms] = _compose(transforms)
+    except TypeError:
+        composed = _compose(transforms)
     return composed
 
 
 def mapping(fn):
     def transform(reducer):
-        def new_reducer(acc, val):
-            return reducer(acc, fn(val))
+        def new_reducer(acc, val, _fn=fn, _reducer=reducer):
+            return _reducer(acc, _fn(val))
 
         return new_reducer
 
+    transform.ops = (("map", fn),)
     return transform
 
 
 def filtering(pred):
     def transform(reducer):
-        def new_reducer(acc, val):
-            if pred(val):
-                return reducer(acc, val)
+        def new_reducer(acc, val, _pred=pred, _reducer=reducer):
+            if _pred(val):
+                return _reducer(acc, val)
             return acc
 
         return new_reducer
 
+    transform.ops = (("filter", pred),)
     return transform
 
 
 def transduce(data: Iterable[Any], xf, reducer: Callable, init: Any):
-    reduce_fn = xf(reducer)
-    acc = init
-    for item in data:
-        acc = reduce_fn(acc, item)
-    return acc
+    fused: Optional[Callable] = getattr(xf, "fused", None)
+    if fused is not None:
+        return fused(data, reducer, init)
+    return reduce(xf(reducer), data, init)
 
 
 # === VERIFICATION ===
@@ -74,7 +142,62 @@ def test_transducer_pipeline():
     assert result == [4, 6]
 
 
+def test_fused_matches_closure_chain():
+    xf = compose_transforms(
+        filtering(lambda x: x % 3),
+        compose_transforms(mapping(lambda x: x + 1), mapping(lambda x: x * 10)),
+        filtering(lambda x: x < 60),
+    )
+    assert hasattr(xf, "fused")
+
+    def add(acc, val):
+        return acc + [val]
+
+    data = range(10)
+    step = xf(add)
+    acc: list = []
+    for item in data:
+        acc = step(acc, item)
+    assert transduce(data, xf, add, []) == acc == [20, 30, 50]
+
+
+def test_composition_is_memoized():
+    double = mapping(lambda x: x * 2)
+    positive = filtering(lambda x: x > 0)
+    assert compose_transforms(double, positive) is compose_transforms(double, positive)
+    assert compose_transforms(positive, double) is not compose_transforms(double, positive)
+
+
+def test_unhashable_transform_is_not_cached():
+    class Doubling:
+        __eq__ = object.__eq__
+        __hash__ = None  # type: ignore[assignment]
+
+        def __call__(self, reducer):
+            return lambda acc, val: reducer(acc, val * 2)
+
+    xf = compose_transforms(Doubling())
+    assert transduce([1, 2], xf, lambda acc, v: acc + [v], []) == [2, 4]
+
+
+def test_untagged_transform_falls_back():
+    def doubling(reducer):
+        return lambda acc, val: reducer(acc, val * 2)
+
+    xf = compose_transforms(doubling, filtering(lambda x: x > 2))
+    assert not hasattr(xf, "fused")
+    assert transduce([1, 2], xf, lambda acc, v: acc + [v], []) == [4]
+
+
 if __name__ == "__main__":
     test_transducer_pipeline()
     print("✅ test_transducer_pipeline passed")
+    test_fused_matches_closure_chain()
+    print("✅ test_fused_matches_closure_chain passed")
+    test_composition_is_memoized()
+    print("✅ test_composition_is_memoized passed")
+    test_unhashable_transform_is_not_cached()
+    print("✅ test_unhashable_transform_is_not_cached passed")
+    test_untagged_transform_falls_back()
+    print("✅ test_untagged_transform_falls_back passed")
     print("\n🎉 All tests passed!")
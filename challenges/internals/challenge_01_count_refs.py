@@ -5,16 +5,17 @@ Time Estimate: 10-15 minutes
 Concepts: sys.getrefcount, reference counting
 
 Problem:
-Implement `count_refs(obj)` that returns sys.getrefcount(obj) minus one (to
-exclude the temporary reference used by getrefcount itself).
+Implement `count_refs(obj)` that returns the reference count the caller would
+see from sys.getrefcount(obj) minus one (excluding getrefcount's temporary).
 
 Requirements:
 1. Use sys.getrefcount.
-2. Return an int that is one less than getrefcount output.
+2. Return an int equal to the caller's sys.getrefcount(obj) - 1.
 3. Do not mutate the object.
 
 Hints:
 - sys.getrefcount temporarily adds a reference.
+- Inside count_refs, the obj parameter is one more reference.
 
 Run tests:
     python challenges/internals/challenge_01_count_refs.py
@@ -6,16 +6,18 @@ Concepts: gc, referential cycles
 
 Problem:
 Detect objects that participate in reference cycles given a list of objects.
-For this exercise, return True if any object is unreachable until gc.collect()
-is called (i.e., gc collects something), else False.
+Return True if any object in the list can reach itself by following
+references (i.e., it is part of a cycle), else False.
 
 Requirements:
-1. Call gc.collect() and check if it collected > 0 objects.
+1. Follow references with gc.get_referents rather than forcing a collection.
 2. Should not raise on arbitrary inputs.
-3. Must enable gc if disabled.
+3. Do not descend into types, modules or functions; they lead into the
+   interpreter's global object graph.
 
 Hints:
-- gc.isenabled and gc.collect are key.
+- Walk depth-first from each object's referents and stop when you see it again.
+- Keep a set of visited ids so shared objects are expanded only once.
 
 Run tests:
     python challenges/internals/challenge_02_find_cycles.py
@@ -2,8 +2,12 @@
 Solution: count_refs
 
 Key Insights:
-1. sys.getrefcount adds a temporary reference; subtract one to report actual.
+1. sys.getrefcount adds a temporary reference for its argument, and
+   count_refs' own obj parameter holds another; subtract both to report the
+   caller's view.
 2. The object itself is not modified; only reference count is observed.
+3. sys.getrefcount is bound to a module global once, so each call does a
+   single global lookup instead of a global plus an attribute lookup.
 
 Alternative Approaches:
 - ctypes can inspect refcounts, but getrefcount is simplest.
@@ -17,8 +21,11 @@ import sys
 # === SOLUTION ===
 
 
+_getrefcount = sys.getrefcount
+
+
 def count_refs(obj) -> int:
-    return sys.getrefcount(obj) - 1
+    return _getrefcount(obj) - 2
 
 
 # === VERIFICATION ===
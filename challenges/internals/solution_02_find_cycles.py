@@ -2,31 +2,48 @@
 Solution: find_cycles
 
 Key Insights:
-1. gc.collect returns the number of unreachable objects collected; >0 implies cycles or otherwise unreferenced objects.
-2. Ensure GC is enabled before collecting; restore previous state if needed.
+1. An object is in a cycle if it can reach itself. gc.get_referents lists what
+   an object points to, so a depth-first walk from each object answers that
+   without triggering a collection.
+2. Live cycles are found too; gc.collect only reports cycles that are already
+   unreachable garbage.
+3. Types, modules, functions and code objects are not descended into. They
+   lead into the interpreter's global object graph, which is full of
+   unrelated cycles and would make the walk O(heap).
+4. A visited set of ids keeps each walk linear in the reachable data.
 
 Alternative Approaches:
-- Use gc.get_objects and graph traversal; gc.collect suffices here.
+- Call gc.collect() and check whether it freed anything; cheap to write, but
+  it sweeps the whole heap, has side effects and misses cycles still in use.
 """
 
 from __future__ import annotations
 
 import gc
+import types
+from typing import Iterable, Set
 
 
 # === SOLUTION ===
 
 
-def find_cycles(objs) -> bool:
-    was_enabled = gc.isenabled()
-    if not was_enabled:
-        gc.enable()
-    try:
-        collected = gc.collect()
-        return collected > 0
-    finally:
-        if not was_enabled:
-            gc.disable()
+_OPAQUE = (type, types.ModuleType, types.FunctionType, types.CodeType)
+
+
+def find_cycles(objs: Iterable[object]) -> bool:
+    for root in objs:
+        seen: Set[int] = set()
+        stack = list(gc.get_referents(root))
+        while stack:
+            obj = stack.pop()
+            if obj is root:
+                return True
+            oid = id(obj)
+            if oid in seen or isinstance(obj, _OPAQUE):
+                continue
+            seen.add(oid)
+            stack.extend(gc.get_referents(obj))
+    return False
 
 
 # === VERIFICATION ===
@@ -50,9 +67,21 @@ def test_no_cycle():
     assert find_cycles(objs) is False
 
 
+def test_chain_without_cycle():
+    class Node:
+        def __init__(self, ref=None):
+            self.ref = ref
+
+    tail = Node()
+    head = Node(tail)
+    assert find_cycles([head, tail]) is False
+
+
 if __name__ == "__main__":
     test_detects_cycle()
     print("✅ test_detects_cycle passed")
     test_no_cycle()
     print("✅ test_no_cycle passed")
+    test_chain_without_cycle()
+    print("✅ test_chain_without_cycle passed")
     print("\n🎉 All tests passed!")
@@ -5,22 +5,50 @@ Key Insights:
 1. Implement __eq__ to allow direct comparisons in tests.
 2. __add__/__sub__ should return new instances to keep objects immutable.
 3. Coerce to float for consistent representation and arithmetic.
+4. __slots__ drops the per-instance __dict__. Arithmetic allocates a fresh
+   Vector per operation, so smaller instances and fixed-offset x/y reads
+   pay off directly.
+5. Vectors are treated as immutable values, so __hash__ hashes the same
+   (x, y) pair that __eq__ compares; equal vectors work as dict keys and set
+   members.
+6. Vector.sum folds many vectors in one loop over two float locals and builds
+   a single result, instead of allocating an intermediate Vector per +.
 
 Alternative Approaches:
-- Use dataclasses for boilerplate reduction.
+- @dataclass(slots=True, frozen=True) generates __eq__/__hash__/__repr__.
+  Frozen instances must coerce to float through object.__setattr__ in
+  __post_init__, which makes construction, and so every __add__/__sub__,
+  several times slower than this plain __init__; the generated __eq__ is
+  no faster either.
+- Store bulk data as two NumPy arrays (structure of arrays) and sum each with
+  SIMD. That adds a dependency and only wins once the data already lives in
+  arrays; converting Vector objects with np.fromiter costs a Python-level
+  pass anyway.
 """
 
 from __future__ import annotations
 
+from typing import Iterable
+
 
 # === SOLUTION ===
 
 
 class Vector:
+    __slots__ = ("x", "y")
+
     def __init__(self, x, y):
         self.x = float(x)
         self.y = float(y)
 
+    @classmethod
+    def sum(cls, vectors: Iterable[Vector]) -> Vector:
+        x = y = 0.0
+        for v in vectors:
+            x += v.x
+            y += v.y
+        return cls(x, y)
+
     def __add__(self, other):
         return Vector(self.x + other.x, self.y + other.y)
 
@@ -30,6 +58,9 @@ class Vector:
     def __eq__(self, other):
         return isinstance(other, Vector) and self.x == other.x and self.y == other.y
 
+    def __hash__(self):
+        return hash((self.x, self.y))
+
     def __repr__(self):
         return f"Vector(x={self.x}, y={self.y})"
 
@@ -45,7 +76,28 @@ def test_add_sub_repr():
     assert repr(v1) == "Vector(x=1.0, y=2.0)"
 
 
+def test_sum():
+    vectors = [Vector(i, -i) for i in range(5)]
+    assert Vector.sum(vectors) == Vector(10, -10)
+    assert Vector.sum(iter(vectors)) == Vector(10, -10)
+    assert Vector.sum([]) == Vector(0, 0)
+
+
+def test_hashable():
+    assert len({Vector(1, 2), Vector(1.0, 2.0), Vector(2, 1)}) == 2
+
+
+def test_no_instance_dict():
+    assert not hasattr(Vector(1, 2), "__dict__")
+
+
 if __name__ == "__main__":
     test_add_sub_repr()
     print("✅ test_add_sub_repr passed")
+    test_sum()
+    print("✅ test_sum passed")
+    test_hashable()
+    print("✅ test_hashable passed")
+    test_no_instance_dict()
+    print("✅ test_no_instance_dict passed")
     print("\n🎉 All tests passed!")
@@ -3,11 +3,18 @@ Solution: observable
 
 Key Insights:
 1. Call subscribers inside the setter to notify on every change.
-2. Trigger notification for the initial value during __init__ to reflect state.
+2. No one can be subscribed during __init__, so subscribe replays the current
+   value to each new callback; subscribers always see the initial state.
 3. Keep subscribers in insertion order using a simple list.
+4. __slots__ lists only the backing fields; the value property lives on the
+   class, so it does not conflict with the slot names.
 
 Alternative Approaches:
 - Provide unsubscribe; omitted here for brevity.
+- Consume map(...) or a generator with deque(maxlen=0).extend to move the
+  loop into C. Each subscriber call still needs a lambda frame (or
+  operator.call), so this measures slower than the plain for loop, which
+  the 3.11+ interpreter already specializes.
 """
 
 from __future__ import annotations
@@ -19,13 +26,15 @@ from typing import Callable, List
 
 
 class Observable:
+    __slots__ = ("_value", "_subs")
+
     def __init__(self, value=None):
         self._value = value
         self._subs: List[Callable] = []
-        self._notify(self._value)
 
     def subscribe(self, fn: Callable):
         self._subs.append(fn)
+        fn(self._value)
 
     @property
     def value(self):
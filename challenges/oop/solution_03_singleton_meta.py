@@ -3,8 +3,14 @@ Solution: singleton_meta
 
 Key Insights:
 1. Overriding metaclass __call__ centralizes instance control per subclass.
-2. A class-level lock prevents races during first creation.
-3. Cache instances in a dict keyed by cls to support multiple singleton classes.
+2. Double-checked locking: once created, an instance is returned without
+   touching any lock.
+3. Each class gets its own creation lock, so first-time construction of
+   unrelated singletons never contends, and a singleton whose __init__
+   creates another singleton cannot deadlock on a shared mutex.
+4. Per-class locks are created lazily under a small guard lock, so two threads
+   cannot install different locks for the same class.
+5. Cache instances in a dict keyed by cls to support multiple singleton classes.
 
 Alternative Approaches:
 - Use __new__ inside the class; metaclass approach keeps logic reusable.
@@ -13,18 +19,24 @@ Alternative Approaches:
 from __future__ import annotations
 
 import threading
+from typing import Any, Dict
 
 
 # === SOLUTION ===
 
 
 class SingletonMeta(type):
-    _instances = {}
-    _lock = threading.Lock()
+    _instances: Dict[type, Any] = {}
+    _locks: Dict[type, threading.Lock] = {}
+    _locks_guard = threading.Lock()
 
     def __call__(cls, *args, **kwargs):
         if cls not in cls._instances:
-            with cls._lock:
+            lock = cls._locks.get(cls)
+            if lock is None:
+                with cls._locks_guard:
+                    lock = cls._locks.setdefault(cls, threading.Lock())
+            with lock:
                 if cls not in cls._instances:
                     cls._instances[cls] = super().__call__(*args, **kwargs)
         return cls._instances[cls]
@@ -58,9 +70,22 @@ def test_thread_safety():
     assert len({id(obj) for obj in results}) == 1
 
 
+def test_nested_singletons_do_not_deadlock():
+    class Inner(metaclass=SingletonMeta):
+        pass
+
+    class Outer(metaclass=SingletonMeta):
+        def __init__(self):
+            self.inner = Inner()
+
+    assert Outer().inner is Inner()
+
+
 if __name__ == "__main__":
     test_single_instance()
     print("✅ test_single_instance passed")
     test_thread_safety()
     print("✅ test_thread_safety passed")
+    test_nested_singletons_do_not_deadlock()
+    print("✅ test_nested_singletons_do_not_deadlock passed")
     print("\n🎉 All tests passed!")
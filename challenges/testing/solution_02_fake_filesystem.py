@@ -5,9 +5,15 @@ Key Insights:
 1. A dict is sufficient to map paths to contents for a lightweight fake.
 2. Raise FileNotFoundError to mirror pathlib/read_text behavior.
 3. Do not delete on read; keep state for repeated reads.
+4. read_text does one dict.get with a private sentinel default instead of a
+   membership test plus an index, so each read hashes and probes once.
 
 Alternative Approaches:
 - Support directories; unnecessary for this exercise.
+- sys.intern paths on write and read. str caches its hash and dict lookups
+  already check identity before equality, so interning on read only adds a
+  second table lookup per call; rewriting a path keeps the original key
+  object, so interning on write saves no memory either.
 """
 
 from __future__ import annotations
@@ -16,6 +22,9 @@ from __future__ import annotations
 # === SOLUTION ===
 
 
+_MISSING = object()
+
+
 class FakeFS:
     def __init__(self):
         self._files = {}
@@ -24,9 +33,10 @@ class FakeFS:
         self._files[path] = content
 
     def read_text(self, path: str) -> str:
-        if path not in self._files:
+        content = self._files.get(path, _MISSING)
+        if content is _MISSING:
             raise FileNotFoundError(path)
-        return self._files[path]
+        return content
 
 
 # === VERIFICATION ===
@@ -5,6 +5,14 @@ Key Insights:
 1. First-run creation seeds the snapshot; later runs compare for stability.
 2. pathlib simplifies file existence checks and reading/writing text.
 3. Raise a clear AssertionError on mismatch to integrate with test runners.
+4. Compare as UTF-8 bytes: a size mismatch from stat() rejects without
+   reading, and otherwise the file is read in 64 KiB chunks that stop at the
+   first differing chunk, so memory stays bounded for large snapshots.
+5. Snapshots are written as UTF-8 bytes, too, so no locale encoding or
+   newline translation can make a fresh snapshot differ from its output.
+6. A new snapshot is written to a unique temp file in the same directory and
+   moved into place with os.replace, which is atomic. Concurrent runs see
+   either no snapshot or a complete one, never a half-written file.
 
 Alternative Approaches:
 - Add newline normalization; not needed here but common in snapshot tools.
@@ -12,19 +20,46 @@ Alternative Approaches:
 
 from __future__ import annotations
 
+import os
+import tempfile
 from pathlib import Path
 
 
 # === SOLUTION ===
 
 
+_CHUNK_SIZE = 64 * 1024
+
+
+def _file_equals(path: Path, expected: bytes) -> bool:
+    if path.stat().st_size != len(expected):
+        return False
+    view = memoryview(expected)
+    with path.open("rb") as f:
+        for start in range(0, len(expected), _CHUNK_SIZE):
+            if f.read(_CHUNK_SIZE) != view[start : start + _CHUNK_SIZE]:
+                return False
+    return True
+
+
+def _write_atomic(path: Path, data: bytes):
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
 def assert_matches_snapshot(output: str, snapshot_path: str | Path):
     path = Path(snapshot_path)
+    data = output.encode("utf-8")
     if not path.exists():
-        path.write_text(output)
+        _write_atomic(path, data)
         return
-    existing = path.read_text()
-    if existing != output:
+    if not _file_equals(path, data):
         raise AssertionError("Snapshot mismatch")
 
 
@@ -35,6 +70,7 @@ def test_creates_and_compares(tmp_path: Path):
     snap = tmp_path / "snap.txt"
     assert_matches_snapshot("hello", snap)
     assert snap.read_text() == "hello"
+    assert [p.name for p in tmp_path.iterdir()] == ["snap.txt"]
     assert_matches_snapshot("hello", snap)
     try:
         assert_matches_snapshot("bye", snap)
@@ -44,10 +80,26 @@ def test_creates_and_compares(tmp_path: Path):
         raise AssertionError("Snapshot mismatch not raised")
 
 
+def test_large_snapshot_mismatch_in_later_chunk(tmp_path: Path):
+    snap = tmp_path / "big.txt"
+    output = "é" * _CHUNK_SIZE
+    assert_matches_snapshot(output, snap)
+    assert_matches_snapshot(output, snap)
+    try:
+        assert_matches_snapshot(output[:-1] + "e", snap)
+    except AssertionError:
+        pass
+    else:
+        raise AssertionError("Snapshot mismatch not raised")
+
+
 if __name__ == "__main__":
     from tempfile import TemporaryDirectory
 
     with TemporaryDirectory() as tmp:
         test_creates_and_compares(Path(tmp))
     print("✅ test_creates_and_compares passed")
+    with TemporaryDirectory() as tmp:
+        test_large_snapshot_mismatch_in_later_chunk(Path(tmp))
+    print("✅ test_large_snapshot_mismatch_in_later_chunk passed")
     print("\n🎉 All tests passed!")
@@ -2,9 +2,13 @@
 Solution: mock_time
 
 Key Insights:
-1. Replace time.time with a lambda returning the fixed value inside the context.
-2. Use try/finally to restore the original function even on exceptions.
-3. contextmanager keeps usage lightweight.
+1. Replace time.time with a function returning the fixed value inside the
+   context.
+2. The replacement is built once at import and reads the value from a
+   module-level cell, so entering the context allocates no closure.
+3. Use try/finally to restore the original function and the previous fixed
+   value even on exceptions; restoring both keeps nested mocks correct.
+4. contextmanager keeps usage lightweight.
 
 Alternative Approaches:
 - Use unittest.mock.patch; manual swap shows the core idea.
@@ -14,19 +18,30 @@ from __future__ import annotations
 
 import time
 from contextlib import contextmanager
+from typing import List
 
 
 # === SOLUTION ===
 
 
+_FIXED: List[float] = [0.0]
+
+
+def _fixed_time() -> float:
+    return _FIXED[0]
+
+
 @contextmanager
 def mock_time(fixed: float):
     original = time.time
-    time.time = lambda: fixed
+    previous = _FIXED[0]
+    _FIXED[0] = fixed
+    time.time = _fixed_time
     try:
         yield
     finally:
         time.time = original
+        _FIXED[0] = previous
 
 
 # === VERIFICATION ===
@@ -39,7 +54,16 @@ def test_mock_time():
     assert time.time() >= before
 
 
+def test_nested_mock_time():
+    with mock_time(1.0):
+        with mock_time(2.0):
+            assert time.time() == 2.0
+        assert time.time() == 1.0
+
+
 if __name__ == "__main__":
     test_mock_time()
     print("✅ test_mock_time passed")
+    test_nested_mock_time()
+    print("✅ test_nested_mock_time passed")
     print("\n🎉 All tests passed!")
@@ -138,12 +138,50 @@ for num in fib_sequence:
     print(f"Fibonacci({num}) = {result}")
 print()
 
+
+def fib_fast(n: int) -> int:
+    """
+    Fast-doubling Fibonacci: O(log n) big-int multiplies instead of n additions.
+
+    Walks the bits of n from the top, keeping (a, b) = (F(k), F(k+1)) and using
+    F(2k) = F(k) * (2F(k+1) - F(k)) and F(2k+1) = F(k)^2 + F(k+1)^2.
+    """
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        c = a * (2 * b - a)
+        d = a * a + b * b
+        a, b = (d, c + d) if bit == "1" else (c, d)
+    return a
+
+
+def fib_loop(n: int) -> int:
+    """The same O(n) loop as fibonacci(), without caching or printing."""
+    a, b = 0, 1
+    for _ in range(n):
+        a, b = b, a + b
+    return a
+
+
+print("Caching helps repeated calls; a better algorithm helps the first one:")
+big_n = 100_000
+start = time.perf_counter()
+loop_result = fib_loop(big_n)
+loop_time = time.perf_counter() - start
+start = time.perf_counter()
+fast_result = fib_fast(big_n)
+fast_time = time.perf_counter() - start
+assert loop_result == fast_result
+print(f"Fibonacci({big_n:,}) is a {fast_result.bit_length():,}-bit integer")
+print(f"  O(n) loop:        {loop_time * 1000:.1f} ms")
+print(f"  fast doubling:    {fast_time * 1000:.1f} ms")
+print()
+
 # Example 5: API simulation with caching
 api_call_count = 0
 
 
 @cache(ttl=8.0)
-def simulate_api_call(endpoint: str, params: dict = None):
+def simulate_api_call(endpoint: str, params: dict | None = None):
     """
     Simulates an API call that benefits from caching.
     """
@@ -175,7 +213,11 @@ result4 = simulate_api_call("/users/123", {"details": "full"})  # Different para
 print(f"Result 4: {result4}\n")
 
 result5 = simulate_api_call("/users/123")  # Should use cache again
-print(f"Result 5: {result5}")
+print(f"Result 5: {result5}\n")
+
+# A new but equal dict is normalized to the same hashable key
+result6 = simulate_api_call("/users/123", {"details": "full"})  # Should cache
+print(f"Result 6: {result6}")
 print()
 
 print("=" * 70)
@@ -188,4 +230,5 @@ print("  • Repeated calls with same args return cached results instantly")
 print("  • Cache expires after the specified TTL (time-to-live)")
 print("  • Perfect for expensive computations, API calls, or database queries")
 print("  • Each function has its own independent cache")
+print("  • Dict/list arguments are normalized into hashable cache keys")
 print("  • Cache hit/miss messages show when caching is working")
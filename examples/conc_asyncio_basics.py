@@ -32,6 +32,16 @@ async def example_sequential_vs_gather() -> None:
     print(f"  sequential {seq_elapsed:.3f}s -> {[a, b]}")
     print(f"  gather    {par_elapsed:.3f}s -> {[a2, b2]}")
 
+    # Python 3.11+: TaskGroup skips gather's result-list bookkeeping and
+    # cancels the remaining tasks as soon as one of them fails
+    if hasattr(asyncio, "TaskGroup"):
+        start = time.perf_counter()
+        async with asyncio.TaskGroup() as tg:
+            t1 = tg.create_task(simulate_io("A", 0.3))
+            t2 = tg.create_task(simulate_io("B", 0.3))
+        tg_elapsed = time.perf_counter() - start
+        print(f"  TaskGroup {tg_elapsed:.3f}s -> {[t1.result(), t2.result()]}")
+
 
 async def example_create_task() -> None:
     print("\nExample 2: create_task fire-and-forget (await later)")
@@ -53,6 +63,20 @@ async def example_as_completed() -> None:
         result = await future
         print("  got:", result)
 
+    # The same with asyncio.wait: you keep the Task objects (to cancel the rest,
+    # read names, etc.) and tasks that finish together come back in one batch.
+    # Each wait() call re-registers callbacks on every pending task, though,
+    # so for thousands of tasks as_completed's single pass scales better.
+    print("  same order with asyncio.wait(FIRST_COMPLETED):")
+    pending = {
+        asyncio.create_task(simulate_io(name, delay))
+        for name, delay in (("fast", 0.1), ("slow", 0.25), ("mid", 0.18))
+    }
+    while pending:
+        done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            print("  got:", task.result())
+
 
 async def example_mix_fast_and_slow() -> None:
     print("\nExample 4: Mixing fast/slow shows non-blocking behavior")
@@ -86,7 +110,14 @@ async def run_all_async() -> None:
 
 
 def run_all() -> None:
-    asyncio.run(run_all_async())
+    # uvloop (optional, not a dependency) swaps in a libuv-based event loop
+    # with cheaper task scheduling; the examples behave the same either way
+    try:
+        import uvloop
+    except ImportError:
+        asyncio.run(run_all_async())
+    else:
+        uvloop.run(run_all_async())
 
 
 if __name__ == "__main__":
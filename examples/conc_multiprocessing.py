@@ -7,6 +7,7 @@ Queues for IPC, shared Value/Array, and a pickling gotcha with lambdas.
 
 from __future__ import annotations
 
+import itertools
 import multiprocessing as mp
 import time
 from concurrent.futures import ProcessPoolExecutor
@@ -29,7 +30,20 @@ def cpu_heavy(n: int) -> int:
     return sum(1 for i in range(n) if is_prime(i))
 
 
-def example_cpu_sequential_vs_processes() -> None:
+def count_primes_sieve(n: int) -> int:
+    # Same count (primes below n) with a Sieve of Eratosthenes: O(n log log n),
+    # and each slice assignment marks all multiples of p in one C-level loop
+    if n < 3:
+        return 0
+    sieve = bytearray(b"\x01") * n
+    sieve[:2] = b"\x00\x00"
+    for p in range(2, int(n**0.5) + 1):
+        if sieve[p]:
+            sieve[p * p :: p] = bytes(len(range(p * p, n, p)))
+    return sieve.count(1)
+
+
+def example_cpu_sequential_vs_processes(ex: ProcessPoolExecutor) -> None:
     print("\nExample 1: CPU-bound sequential vs processes")
     inputs = [50_000, 60_000, 55_000, 52_000]
 
@@ -38,57 +52,72 @@ def example_cpu_sequential_vs_processes() -> None:
     seq_elapsed = time.perf_counter() - start
 
     start = time.perf_counter()
-    with ProcessPoolExecutor() as ex:
-        par = list(ex.map(cpu_heavy, inputs))
+    par = list(ex.map(cpu_heavy, inputs))
     par_elapsed = time.perf_counter() - start
 
+    start = time.perf_counter()
+    sieved = [count_primes_sieve(n) for n in inputs]
+    sieve_elapsed = time.perf_counter() - start
+    assert sieved == seq
+
     print(f"  sequential: {seq_elapsed:.3f}s -> {seq}")
     print(f"  processes:  {par_elapsed:.3f}s -> {par}")
     print("  Processes should show real speedup on CPU-bound work vs threads.")
+    print(f"  sieve, one process: {sieve_elapsed:.3f}s -> {sieved}")
+    print("  A better algorithm often beats adding cores; parallelize what remains.")
 
 
 def example_shared_value_and_queue() -> None:
     print("\nExample 2: Shared Value/Array and Queue IPC")
     counter = mp.Value("i", 0)
-    results: mp.Queue[int] = mp.Queue()
-
-    def worker(n: int, counter: mp.Value, out: mp.Queue[int]) -> None:
-        local = cpu_heavy(n)
+    results: mp.Queue[list[int]] = mp.Queue()
+
+    # Each put() pickles its payload and writes it to a pipe, and the parent
+    # unpickles every get() in turn, so send one list per worker rather than
+    # one message per result
+    def worker(batch: list[int], counter: mp.Value, out: mp.Queue[list[int]]) -> None:
+        local = [cpu_heavy(n) for n in batch]
+        # value += 1 is a read then a write, so it needs the lock; taken once
+        # per worker it costs nothing measurable. An unlocked mp.RawValue would
+        # need an atomic fetch-add, which Python only reaches via a C extension
         with counter.get_lock():
             counter.value += 1
         out.put(local)
 
-    inputs = [20_000, 22_000, 24_000]
-    procs = [mp.Process(target=worker, args=(n, counter, results)) for n in inputs]
+    inputs = [20_000, 22_000, 24_000, 21_000, 23_000, 25_000]
+    n_workers = 3
+    batches = [inputs[i::n_workers] for i in range(n_workers)]
+    procs = [mp.Process(target=worker, args=(b, counter, results)) for b in batches]
     for p in procs:
         p.start()
+    # Drain before join: a child blocks on exit until its queued data is read
+    collected = list(itertools.chain.from_iterable(results.get() for _ in procs))
     for p in procs:
         p.join()
 
-    collected = [results.get() for _ in inputs]
     print(f"  completed workers: {counter.value}")
-    print(f"  results: {collected}")
+    print(f"  results ({len(collected)} from {len(procs)} messages): {collected}")
 
 
-def example_pickling_gotcha() -> None:
+def example_pickling_gotcha(ex: ProcessPoolExecutor) -> None:
     print("\nExample 3: Lambdas/closures do not pickle in ProcessPool")
+    # Provoke the failure on a throwaway one-worker pool so the shared pool
+    # never sees the error path
     try:
-        with ProcessPoolExecutor() as ex:
-            list(ex.map(lambda x: x + 1, [1, 2, 3]))
+        with ProcessPoolExecutor(max_workers=1) as scratch:
+            list(scratch.map(lambda x: x + 1, [1, 2, 3]))
     except Exception as exc:
         print(f"  expected pickling failure: {type(exc).__name__}: {exc}")
 
     # Fix: use top-level functions instead of lambdas/closures
-    with ProcessPoolExecutor() as ex:
-        fixed = list(ex.map(int, ["1", "2", "3"]))
+    fixed = list(ex.map(int, ["1", "2", "3"]))
     print(f"  fixed by using top-level callable: {fixed}")
 
 
-def example_process_pool_map() -> None:
+def example_process_pool_map(ex: ProcessPoolExecutor) -> None:
     print("\nExample 4: ProcessPoolExecutor.map for bulk CPU tasks")
     inputs = [30_000, 30_000, 30_000]
-    with ProcessPoolExecutor() as ex:
-        results = list(ex.map(cpu_heavy, inputs))
+    results = list(ex.map(cpu_heavy, inputs))
     print(f"  results: {results}")
 
 
@@ -97,10 +126,13 @@ def run_all() -> None:
     print("DEMONSTRATING MULTIPROCESSING")
     print("=" * 70)
 
-    example_cpu_sequential_vs_processes()
-    example_shared_value_and_queue()
-    example_pickling_gotcha()
-    example_process_pool_map()
+    # One pool for every example: starting workers (a fresh interpreter each
+    # under the spawn start method used on Windows and macOS) is paid once
+    with ProcessPoolExecutor() as ex:
+        example_cpu_sequential_vs_processes(ex)
+        example_shared_value_and_queue()
+        example_pickling_gotcha(ex)
+        example_process_pool_map(ex)
 
     print("\nAll multiprocessing examples completed.")
 
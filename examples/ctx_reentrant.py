@@ -13,14 +13,14 @@ from python_mastery.context_managers import Reusable, SingleUse
 
 def example_single_use_once() -> None:
     print("\nExample 1: SingleUse works the first time")
-    cm = SingleUse()
+    cm = SingleUse(verbose=True)
     with cm:
         print("  inside SingleUse (first run)")
 
 
 def example_single_use_reuse_error() -> None:
     print("\nExample 2: SingleUse cannot be re-entered")
-    cm = SingleUse()
+    cm = SingleUse(verbose=True)
     with cm:
         print("  initial use succeeds")
     try:
@@ -33,7 +33,7 @@ def example_single_use_reuse_error() -> None:
 
 def example_reusable_multiple_times() -> None:
     print("\nExample 3: Reusable can enter multiple times")
-    cm = Reusable()
+    cm = Reusable(verbose=True)
     for i in range(3):
         with cm:
             print(f"  inside Reusable run #{i + 1}")
@@ -41,7 +41,7 @@ def example_reusable_multiple_times() -> None:
 
 def example_exception_handling() -> None:
     print("\nExample 4: __exit__ still runs on exceptions")
-    cm = Reusable()
+    cm = Reusable(verbose=True)
     try:
         with cm:
             print("  inside reusable; about to raise")
@@ -19,10 +19,11 @@ Available Context Managers:
 - AsyncTimer: Async version of Timer
 - env_var: Temporarily set environment variables
 - Reusable: Example of a reusable context manager
+- SingleUse: Example of a context manager that refuses reentry
 """
 
 from .async_ctx import AsyncTimer
-from .reentrant import Reusable
+from .reentrant import Reusable, SingleUse
 from .state import env_var
 from .timer import Timer, timer_context
 from .utilities import (
@@ -35,6 +36,7 @@ from .utilities import (
 __all__ = [
     "AsyncTimer",
     "Reusable",
+    "SingleUse",
     "Timer",
     "demonstrate_closing",
     "demonstrate_exit_stack",
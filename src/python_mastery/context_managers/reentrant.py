@@ -7,6 +7,9 @@ Demonstrates the difference between single-use and reusable context managers.
 Most context managers (like 'open()') are single-use. Once you exit them,
 you cannot enter them again. Reentrant context managers allow you to
 enter/exit multiple times.
+
+Both managers are quiet by default so that entering them costs only a flag
+check and an attribute update; pass verbose=True to print each entry/exit.
 """
 
 
@@ -15,18 +18,21 @@ class SingleUse:
     Typical context manager. Can only be used once.
     """
 
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.used = False
+        self.verbose = verbose
 
     def __enter__(self):
         if self.used:
             raise RuntimeError("Cannot reuse this context manager!")
         self.used = True
-        print("Entering SingleUse")
+        if self.verbose:
+            print("Entering SingleUse")
         return self
 
     def __exit__(self, *args):
-        print("Exiting SingleUse")
+        if self.verbose:
+            print("Exiting SingleUse")
 
 
 class Reusable:
@@ -35,21 +41,24 @@ class Reusable:
     Useful for connection pools, thread locks, etc.
     """
 
-    def __init__(self):
+    def __init__(self, verbose: bool = False):
         self.count = 0
+        self.verbose = verbose
 
     def __enter__(self):
         self.count += 1
-        print(f"Entering Reusable (usage #{self.count})")
+        if self.verbose:
+            print(f"Entering Reusable (usage #{self.count})")
         return self
 
     def __exit__(self, *args):
-        print(f"Exiting Reusable (usage #{self.count})")
+        if self.verbose:
+            print(f"Exiting Reusable (usage #{self.count})")
 
 
 def demonstrate_reentrancy():
     print("--- Single Use ---")
-    single = SingleUse()
+    single = SingleUse(verbose=True)
 
     with single:
         pass
@@ -62,7 +71,7 @@ def demonstrate_reentrancy():
         print(f"Caught expected error: {e}")
 
     print("\n--- Reusable ---")
-    reusable = Reusable()
+    reusable = Reusable(verbose=True)
 
     with reusable:
         pass
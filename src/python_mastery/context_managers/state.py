@@ -16,8 +16,9 @@ def env_var(key, value):
     Temporarily set an environment variable.
     Restores the original value (or deletes if it didn't exist) on exit.
     """
-    old_value = os.environ.get(key)
-    os.environ[key] = value
+    environ = os.environ
+    old_value = environ.get(key)
+    environ[key] = value
 
     print(f"Set ENV['{key}'] = '{value}'")
 
@@ -25,10 +26,11 @@ def env_var(key, value):
         yield
     finally:
         if old_value is None:
-            del os.environ[key]
+            # pop tolerates the body having already removed the variable
+            environ.pop(key, None)
             print(f"Deleted ENV['{key}']")
         else:
-            os.environ[key] = old_value
+            environ[key] = old_value
             print(f"Restored ENV['{key}'] to '{old_value}'")
 
 
@@ -8,6 +8,7 @@ Mastering these prevents you from reinventing the wheel.
 
 import os
 from contextlib import ExitStack, closing, nullcontext, suppress
+from pathlib import Path
 
 
 def demonstrate_suppress():
@@ -95,8 +96,10 @@ def demonstrate_exit_stack():
         # 'with open(f1), open(f2)...' requires knowing the number of files beforehand.
 
         with ExitStack() as stack:
-            # Dynamically enter contexts
-            files = [stack.enter_context(open(f)) for f in filenames]
+            # Dynamically enter contexts: map() opens each file and hands it
+            # straight to enter_context, so every file opened so far is
+            # registered for cleanup even if a later open() fails
+            files = list(map(stack.enter_context, map(open, filenames)))
 
             print(f"Opened {len(files)} files simultaneously:")
             for file_obj in files:
@@ -105,10 +108,10 @@ def demonstrate_exit_stack():
             # When this block exits, stack.close() is called, closing ALL files
             # in reverse order.
     finally:
-        # Cleanup
-        with suppress(FileNotFoundError):
-            for f in filenames:
-                os.remove(f)
+        # Cleanup: missing_ok handles each file on its own, so one missing file
+        # cannot abort the loop and leave the remaining files behind
+        for f in filenames:
+            Path(f).unlink(missing_ok=True)
 
 
 if __name__ == "__main__":
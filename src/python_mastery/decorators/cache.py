@@ -10,14 +10,18 @@ import functools
 import logging
 import threading
 import time
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from collections.abc import Callable
+from operator import itemgetter
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Separates positional from keyword arguments inside a cache key
+_KWARGS_MARK = (object(),)
 
-def cache(ttl: float = 300.0, maxsize: int | None = None):
+
+def cache(ttl: float = 300.0, maxsize: int | None = 128):
     """
     A decorator that caches function results with time-to-live expiration.
 
@@ -27,13 +31,18 @@ def cache(ttl: float = 300.0, maxsize: int | None = None):
 
     Features:
         - Thread-safe using threading.Lock
-        - Optional LRU eviction when maxsize is set
+        - Bounded by default: LRU eviction once maxsize entries are cached
+        - Expired entries are dropped lazily on insert, even for keys that are
+          never requested again, so memory stays bounded without maxsize too
         - Supports both sync and async functions
+        - dict, list and set arguments are converted to hashable keys; their
+          contents must then be hashable (or convertible in turn)
 
     Args:
         ttl: Time-to-live in seconds (default: 300.0 = 5 minutes)
-        maxsize: Maximum number of cached entries. None means unlimited.
-                 When exceeded, least recently used entries are evicted.
+        maxsize: Maximum number of cached entries (default: 128, as in
+                 functools.lru_cache). None means unlimited. When exceeded,
+                 least recently used entries are evicted.
 
     Returns:
         A decorator that caches function results
@@ -54,76 +63,146 @@ def cache(ttl: float = 300.0, maxsize: int | None = None):
         lock = threading.Lock()
 
         # OrderedDict to store cached results with LRU ordering
-        # Key: arguments tuple, Value: (result, timestamp)
+        # Key: arguments tuple, Value: (result, monotonic expiry deadline)
         cache_store: OrderedDict[tuple, tuple[Any, float]] = OrderedDict()
 
+        # (deadline, key) per insert, oldest first. Every entry gets the same
+        # ttl and _store_result reads the clock while holding the lock, so
+        # deadlines are appended in non-decreasing order and a FIFO gives the
+        # lazy-expiry order a heap would, in O(1) per entry
+        expiry_queue: deque[tuple[float, tuple]] = deque()
+
         def _make_hashable(obj: Any) -> Any:
             """Convert an object to a hashable version."""
             if isinstance(obj, dict):
-                return tuple(sorted((k, _make_hashable(v)) for k, v in obj.items()))
+                # frozenset: order-insensitive without sorting, so keys of
+                # mixed, unorderable types work too
+                return frozenset((k, _make_hashable(v)) for k, v in obj.items())
             if isinstance(obj, (list, set)):
                 return tuple(_make_hashable(item) for item in obj)
             return obj
 
         def _make_key(args: tuple, kwargs: dict) -> tuple:
-            """Create a hashable cache key from function arguments."""
-            hashable_args = tuple(_make_hashable(arg) for arg in args)
-            hashable_kwargs = tuple(
-                sorted((k, _make_hashable(v)) for k, v in kwargs.items())
-            )
-            return (hashable_args, hashable_kwargs)
-
-        def _get_cached(key: tuple, current_time: float) -> tuple[bool, Any]:
+            """
+            Create a hashable cache key from function arguments.
+
+            Like functools.lru_cache, the positional args tuple itself is the
+            key when there are no kwargs, so the common call allocates nothing.
+            Keyword arguments are appended after a marker, sorted only when
+            there is more than one. The key is not hash-checked here: tuples
+            do not cache their hash, so a probe would hash it once more on
+            every call. The lookup raises TypeError for unhashable arguments
+            instead, and the wrappers then fall back to _make_hashable_key.
+
+            Generating an exact-arity wrapper per function (def wrapper(a, b),
+            key = (a, b)) was measured to save only a few percent per hit;
+            the lock, the LRU bookkeeping and the logging call dominate.
+
+            Hashing pickle.dumps() of the arguments (with xxh3 or blake2b) is
+            a little faster for small dicts, but not a valid key: equal dicts
+            built in a different order pickle to different bytes, unpicklable
+            arguments fail, and a digest-only key can collide and return
+            another call's result.
+            """
+            key = args
+            if kwargs:
+                items = tuple(kwargs.items())
+                if len(items) > 1:
+                    items = tuple(sorted(items))
+                key += _KWARGS_MARK + items
+            return key
+
+        def _make_hashable_key(args: tuple, kwargs: dict) -> tuple:
+            """Create a cache key with dict, list and set arguments converted."""
+            key = tuple(_make_hashable(arg) for arg in args)
+            if kwargs:
+                key += _KWARGS_MARK + tuple(
+                    sorted((k, _make_hashable(v)) for k, v in kwargs.items())
+                )
+            return key
+
+        def _get_cached(key: tuple, now: float) -> tuple[bool, Any]:
             """
             Check cache for valid entry. Returns (found, result).
             Must be called with lock held.
             """
-            if key in cache_store:
-                cached_result, timestamp = cache_store[key]
-                if current_time - timestamp < ttl:
+            entry = cache_store.get(key)
+            if entry is not None:
+                cached_result, deadline = entry
+                if now < deadline:
                     # Move to end for LRU ordering
                     cache_store.move_to_end(key)
                     return True, cached_result
-                else:
-                    # Cache expired, remove it
-                    del cache_store[key]
+                # Cache expired, remove it
+                del cache_store[key]
             return False, None
 
-        def _store_result(key: tuple, result: Any, current_time: float) -> None:
+        def _store_result(key: tuple, result: Any) -> None:
             """
             Store result in cache with LRU eviction.
             Must be called with lock held.
             """
-            cache_store[key] = (result, current_time)
+            # Read the clock here, under the lock, to keep expiry_queue sorted
+            now = time.monotonic()
+            deadline = now + ttl
+            cache_store[key] = (result, deadline)
             cache_store.move_to_end(key)
+            expiry_queue.append((deadline, key))
+
+            # Drop expired entries; skip stale queue items whose key was
+            # evicted, expired on access or stored again with a later deadline
+            while expiry_queue and expiry_queue[0][0] <= now:
+                old_deadline, old_key = expiry_queue.popleft()
+                entry = cache_store.get(old_key)
+                if entry is not None and entry[1] == old_deadline:
+                    del cache_store[old_key]
 
-            # Evict oldest entries if maxsize exceeded
+            # Evict least recently used entries if maxsize exceeded
             if maxsize is not None:
                 while len(cache_store) > maxsize:
                     cache_store.popitem(last=False)
 
+            # Once stale items outnumber live entries (e.g. LRU evictions under
+            # a long ttl), rebuild the queue from the live entries; this costs
+            # O(n log n) at most once per n inserts
+            if len(expiry_queue) > 2 * len(cache_store) + 64:
+                live = ((d, k) for k, (_, d) in cache_store.items())
+                expiry_queue.clear()
+                expiry_queue.extend(sorted(live, key=itemgetter(0)))
+
+        # The hit/miss logger.debug calls stay in the wrappers even though a
+        # disabled call still costs ~0.2us. Picking a silent wrapper at
+        # decoration time would ignore logging configured afterwards
+        # (dictConfig at startup, pytest's caplog.at_level), which is
+        # usually when it happens.
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Async wrapper with thread-safe caching."""
                 key = _make_key(args, kwargs)
-                current_time = time.time()
+                now = time.monotonic()
 
                 with lock:
-                    found, cached_result = _get_cached(key, current_time)
-                    if found:
-                        logger.debug(
-                            "Cache hit for %s%s, %s", func.__name__, args, kwargs
-                        )
-                        return cached_result
-
-                # Cache miss - call the original async function outside lock
+                    try:
+                        found, cached_result = _get_cached(key, now)
+                    except TypeError:
+                        # Unhashable argument; convert only on this slow path
+                        key = _make_hashable_key(args, kwargs)
+                        found, cached_result = _get_cached(key, now)
+
+                # Log outside the lock: with DEBUG enabled, handler I/O would
+                # otherwise serialize every other caller behind this one
+                if found:
+                    logger.debug("Cache hit for %s%s, %s", func.__name__, args, kwargs)
+                    return cached_result
+
+                # Cache miss - call the original async function
                 logger.debug("Cache miss for %s%s, %s", func.__name__, args, kwargs)
                 result = await func(*args, **kwargs)
 
                 with lock:
-                    _store_result(key, result, time.time())
+                    _store_result(key, result)
 
                 return result
 
@@ -134,22 +213,28 @@ def cache(ttl: float = 300.0, maxsize: int | None = None):
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Sync wrapper with thread-safe caching."""
                 key = _make_key(args, kwargs)
-                current_time = time.time()
+                now = time.monotonic()
 
                 with lock:
-                    found, cached_result = _get_cached(key, current_time)
-                    if found:
-                        logger.debug(
-                            "Cache hit for %s%s, %s", func.__name__, args, kwargs
-                        )
-                        return cached_result
-
-                # Cache miss - call the original function outside lock
+                    try:
+                        found, cached_result = _get_cached(key, now)
+                    except TypeError:
+                        # Unhashable argument; convert only on this slow path
+                        key = _make_hashable_key(args, kwargs)
+                        found, cached_result = _get_cached(key, now)
+
+                # Log outside the lock: with DEBUG enabled, handler I/O would
+                # otherwise serialize every other caller behind this one
+                if found:
+                    logger.debug("Cache hit for %s%s, %s", func.__name__, args, kwargs)
+                    return cached_result
+
+                # Cache miss - call the original function
                 logger.debug("Cache miss for %s%s, %s", func.__name__, args, kwargs)
                 result = func(*args, **kwargs)
 
                 with lock:
-                    _store_result(key, result, time.time())
+                    _store_result(key, result)
 
                 return result
 
@@ -60,32 +60,20 @@ def retry(
             A wrapper function with retry capability
         """
 
+        # The backoff schedule is fixed per decoration, so compute it once;
+        # a failing call just indexes it instead of redoing the float math
+        delays = tuple(delay * backoff**i for i in range(max(max_attempts - 1, 0)))
+
         if asyncio.iscoroutinefunction(func):
 
             @functools.wraps(func)
             async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Async wrapper with retry logic."""
-                attempts = 0
-                current_delay = delay
-                last_exception: Exception = RuntimeError("No attempts made")
-
-                while attempts < max_attempts:
-                    attempts += 1
-
+                for attempt in range(1, max_attempts + 1):
                     try:
                         result = await func(*args, **kwargs)
-                        if attempts > 1:
-                            logger.info(
-                                "Function '%s' succeeded on attempt %d",
-                                func.__name__,
-                                attempts,
-                            )
-                        return result
-
                     except exceptions as e:
-                        last_exception = e
-
-                        if attempts == max_attempts:
+                        if attempt == max_attempts:
                             logger.error(
                                 "Function '%s' failed after %d attempts",
                                 func.__name__,
@@ -93,19 +81,29 @@ def retry(
                             )
                             raise RetryExhausted(func.__name__, max_attempts, e) from e
 
+                        pause = delays[attempt - 1]
                         logger.warning(
                             "Function '%s' failed on attempt %d: %s",
                             func.__name__,
-                            attempts,
+                            attempt,
                             e,
                         )
-                        logger.debug("Retrying in %.1f seconds...", current_delay)
+                        logger.debug("Retrying in %.1f seconds...", pause)
 
-                        await asyncio.sleep(current_delay)
-                        current_delay *= backoff
+                        await asyncio.sleep(pause)
+                    else:
+                        if attempt > 1:
+                            logger.info(
+                                "Function '%s' succeeded on attempt %d",
+                                func.__name__,
+                                attempt,
+                            )
+                        return result
 
-                # Should never reach here
-                raise RetryExhausted(func.__name__, max_attempts, last_exception)
+                # Only reached when max_attempts < 1
+                raise RetryExhausted(
+                    func.__name__, max_attempts, RuntimeError("No attempts made")
+                )
 
             return async_wrapper
         else:
@@ -113,27 +111,11 @@ def retry(
             @functools.wraps(func)
             def wrapper(*args: Any, **kwargs: Any) -> Any:
                 """Sync wrapper with retry logic."""
-                attempts = 0
-                current_delay = delay
-                last_exception: Exception = RuntimeError("No attempts made")
-
-                while attempts < max_attempts:
-                    attempts += 1
-
+                for attempt in range(1, max_attempts + 1):
                     try:
                         result = func(*args, **kwargs)
-                        if attempts > 1:
-                            logger.info(
-                                "Function '%s' succeeded on attempt %d",
-                                func.__name__,
-                                attempts,
-                            )
-                        return result
-
                     except exceptions as e:
-                        last_exception = e
-
-                        if attempts == max_attempts:
+                        if attempt == max_attempts:
                             logger.error(
                                 "Function '%s' failed after %d attempts",
                                 func.__name__,
@@ -141,19 +123,29 @@ def retry(
                             )
                             raise RetryExhausted(func.__name__, max_attempts, e) from e
 
+                        pause = delays[attempt - 1]
                         logger.warning(
                             "Function '%s' failed on attempt %d: %s",
                             func.__name__,
-                            attempts,
+                            attempt,
                             e,
                         )
-                        logger.debug("Retrying in %.1f seconds...", current_delay)
+                        logger.debug("Retrying in %.1f seconds...", pause)
 
-                        time.sleep(current_delay)
-                        current_delay *= backoff
+                        time.sleep(pause)
+                    else:
+                        if attempt > 1:
+                            logger.info(
+                                "Function '%s' succeeded on attempt %d",
+                                func.__name__,
+                                attempt,
+                            )
+                        return result
 
-                # Should never reach here
-                raise RetryExhausted(func.__name__, max_attempts, last_exception)
+                # Only reached when max_attempts < 1
+                raise RetryExhausted(
+                    func.__name__, max_attempts, RuntimeError("No attempts made")
+                )
 
             return wrapper
 
@@ -184,6 +184,15 @@ class TestEnvVar:
 
         assert os.environ.get(key) is None
 
+    def test_env_var_tolerates_removal_inside_block(self, clean_env):
+        """env_var should not fail if the block already removed a new variable."""
+        key = "REMOVED_VAR"
+
+        with env_var(key, "temporary"):
+            del os.environ[key]
+
+        assert os.environ.get(key) is None
+
     def test_env_var_restores_on_exception(self, clean_env):
         """env_var should restore value even if exception occurs."""
         os.environ["EXCEPTION_VAR"] = "original"
@@ -229,8 +238,8 @@ class TestReusable:
             assert reusable.count == 2
 
     def test_reusable_prints_usage_info(self, capsys):
-        """Reusable should print entry/exit messages with count."""
-        reusable = Reusable()
+        """Reusable should print entry/exit messages with count when verbose."""
+        reusable = Reusable(verbose=True)
 
         with reusable:
             pass
@@ -240,13 +249,23 @@ class TestReusable:
         assert "Exiting Reusable" in output
         assert "#1" in output
 
+    def test_reusable_is_quiet_by_default(self, capsys):
+        """Reusable should not print unless verbose is set."""
+        reusable = Reusable()
+
+        with reusable:
+            pass
+
+        assert capsys.readouterr().out == ""
+        assert reusable.count == 1
+
 
 class TestSingleUse:
     """Tests for the SingleUse context manager."""
 
     def test_single_use_works_once(self, capsys):
         """SingleUse should work on first use."""
-        single = SingleUse()
+        single = SingleUse(verbose=True)
 
         with single:
             pass
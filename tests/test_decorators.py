@@ -320,6 +320,20 @@ class TestRetryDecorator:
         assert result == "a=hello, b=world, c=None"
         assert call_count == 2
 
+    def test_retry_backoff_schedule(self, monkeypatch):
+        """Test that delays grow by the backoff factor between attempts."""
+        pauses = []
+        monkeypatch.setattr(time, "sleep", pauses.append)
+
+        @retry(max_attempts=4, delay=0.5, backoff=2.0)
+        def always_fails():
+            raise ValueError("nope")
+
+        with pytest.raises(RetryExhausted):
+            always_fails()
+
+        assert pauses == [0.5, 1.0, 2.0]
+
     def test_retry_delay_between_attempts(self):
         """Test that @retry waits the specified delay between attempts."""
         call_count = 0
@@ -588,6 +602,72 @@ class TestCacheDecorator:
         assert result3 == 10
         assert call_count == 2
 
+    def test_cache_keyword_order_and_dict_arguments(self):
+        """Keyword order should not matter, and dict arguments should be cacheable."""
+        call_count = 0
+
+        @cache(ttl=10.0)
+        def lookup(endpoint, params=None, page=1):
+            nonlocal call_count
+            call_count += 1
+            return endpoint, page
+
+        lookup("users", params={"a": 1}, page=2)
+        lookup("users", page=2, params={"a": 1})
+        assert call_count == 1
+
+        # A dict argument must not collide with the same values passed as kwargs
+        lookup("users", {"a": 1})
+        assert call_count == 2
+
+        # Dicts with unorderable mixed key types must still produce a key
+        lookup("users", {1: "x", "a": 2})
+        lookup("users", {"a": 2, 1: "x"})
+        assert call_count == 3
+
+    def test_cache_is_bounded_by_default(self):
+        """The default maxsize should evict least recently used entries."""
+        call_count = 0
+
+        @cache(ttl=10.0)
+        def square(x):
+            nonlocal call_count
+            call_count += 1
+            return x * x
+
+        for x in range(129):
+            square(x)
+        assert call_count == 129
+
+        square(128)  # Most recent entry is still cached
+        assert call_count == 129
+        square(0)  # Oldest entry was evicted
+        assert call_count == 130
+
+    def test_cache_expiry_queue_drops_expired_before_lru_eviction(self, monkeypatch):
+        """Expired entries should leave via the expiry queue, not evict live ones."""
+        clock = [1000.0]
+        monkeypatch.setattr(time, "monotonic", lambda: clock[0])
+        call_count = 0
+
+        @cache(ttl=0.4, maxsize=3)
+        def identity(x):
+            nonlocal call_count
+            call_count += 1
+            return x
+
+        identity("stale")
+        clock[0] += 0.3
+        identity("live")
+        identity("stale")  # Hit: "stale" becomes most recently used
+        clock[0] += 0.2  # "stale" has now expired, "live" has not
+        identity("b")  # Insert pops "stale" off the front of the expiry queue
+        identity("c")  # Fits in maxsize, so LRU eviction keeps "live"
+        assert call_count == 4
+
+        identity("live")
+        assert call_count == 4
+
     def test_cache_independent_instances(self):
         """Test that different decorated functions have independent caches."""
         call_count1 = 0